@@ -13,6 +13,8 @@ from typing import Optional
 
 import pytz
 
+from core.trade_log import trades_on_date
+
 # Try to import Firestore client
 try:
     from database.firestore import FirestoreClient
@@ -387,13 +389,7 @@ def analyze_no_trade_reason(
 
     # Check if there were trades
     try:
-        with open(trades_file, "r") as f:
-            all_trades = json.load(f)
-
-        todays_trades = [
-            t for t in all_trades
-            if t.get("timestamp_utc", "")[:10] == date
-        ]
+        todays_trades = trades_on_date(trades_file, date)
 
         if todays_trades:
             return NoTradeReason(
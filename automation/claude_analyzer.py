@@ -2,31 +2,207 @@
 Claude Code integration for strategy analysis.
 Generates prompts from reports and parses Claude responses for strategy modifications.
 """
+from __future__ import annotations
+
+import io
 import json
 import logging
+import operator
 import os
 import re
+import string
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import pyjson5
+    PYJSON5_AVAILABLE = True
+except ImportError:
+    PYJSON5_AVAILABLE = False
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import StrategyConfig, get_settings
-from database.firestore import FirestoreClient
 from notifications.discord import DiscordNotifier
-from reports.report_generator import AnalysisReport, ReportGenerator
 from strategy.rag_retriever import RAGRetriever
 from strategy.regime import RegimeClassifier
 
+if TYPE_CHECKING:
+    # Imported where used: Firestore pulls in google-cloud, reports pull in pandas
+    from database.firestore import FirestoreClient
+    from reports.report_generator import AnalysisReport, ReportGenerator
+
 logger = logging.getLogger(__name__)
 
+# Extracts StrategyModification fields (in declaration order) from a response dict
+_MODIFICATION_KEYS = operator.itemgetter("parameter", "old_value", "new_value", "reason")
+
+# StrategyConfig's field set is fixed at import; avoid walking fields() per call
+_STRATEGY_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(StrategyConfig))
+
+
+_JSON_FENCE_OPEN = "```json"
+_JSON_FENCE_CLOSE = "```"
+
+# Lenient JSON5 parsing is ~600x slower than json; only try it on responses
+# that look like JSON5 (trailing commas, comments) and aren't huge
+_LENIENT_MAX_CHARS = 64_000
+_JSON5_HINT_RE = re.compile(r",\s*[}\]]|//|/\*")
+
+# Shape of one analysis result; summary/confidence fall back to defaults
+_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "modifications": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["parameter", "old_value", "new_value", "reason"],
+            },
+        },
+    },
+}
+_BATCH_SCHEMA = {
+    "type": "object",
+    "required": ["results"],
+    "properties": {"results": {"type": "array", "items": _RESULT_SCHEMA}},
+}
+
+# Compiled to plain Python validators once at import
+if FASTJSONSCHEMA_AVAILABLE:
+    _validate_result = fastjsonschema.compile(_RESULT_SCHEMA)
+    _validate_batch = fastjsonschema.compile(_BATCH_SCHEMA)
+else:
+    _validate_result = _validate_batch = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps_indented(obj) -> str:
+    """Serialize to 2-space indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
+        except TypeError:
+            # Types orjson can't serialize fall back to stdlib behavior
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# JSON extraction uses plain substring searches rather than regexes: a
+# greedy DOTALL pattern backtracks over the whole response for every "{"
+# that has no closing brace, while find/rfind are single linear scans.
+def _fenced_json(text: str) -> Optional[str]:
+    """Get the body of the first ```json fenced block, stripped of whitespace."""
+    start = text.find(_JSON_FENCE_OPEN)
+    if start < 0:
+        return None
+    start += len(_JSON_FENCE_OPEN)
+    end = text.find(_JSON_FENCE_CLOSE, start)
+    if end < 0:
+        return None
+    return text[start:end].strip()
+
+
+def _brace_span(text: str) -> Optional[str]:
+    """Get the span from the first "{" to the last "}" after it."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    end = text.rfind("}")
+    if end < start:
+        return None
+    return text[start:end + 1]
+
+
+def _schema_error(validate, data) -> Optional[str]:
+    """Run a compiled schema validator, returning its error message if any."""
+    if validate is None:
+        return None
+    try:
+        validate(data)
+    except fastjsonschema.JsonSchemaException as e:
+        return e.message
+    return None
+
+
+def _config_values(config: StrategyConfig) -> tuple:
+    """Snapshot all StrategyConfig values in field order."""
+    return tuple(getattr(config, name) for name in _STRATEGY_FIELDS)
+
+
+# Boolean parameters (toggles) Claude may flip
+_BOOLEAN_PARAMS = frozenset({
+    "vwap_filter_enabled",
+    "vwap_entry_below",
+    "atr_stop_enabled",
+    "bb_filter_enabled",
+    "volume_filter_enabled",
+    "short_enabled",
+})
+
+# Numeric parameters Claude may tune: name -> (min, max, max change per analysis)
+_PARAM_LIMITS: dict[str, tuple[float, float, float]] = {
+    "rsi_oversold": (5.0, 95.0, 50.0),
+    "rsi_overbought": (5.0, 95.0, 50.0),
+    "stop_loss_pct": (0.01, 0.20, 0.10),
+    "position_size_pct": (0.10, 1.0, 0.50),
+    "atr_stop_multiplier": (0.5, 5.0, 2.0),
+    "bb_std_dev": (0.5, 4.0, 2.0),
+    "volume_min_ratio": (0.1, 3.0, 1.5),
+    "rsi_overbought_short": (5.0, 95.0, 50.0),
+    "rsi_oversold_short": (5.0, 95.0, 50.0),
+    "short_stop_loss_pct": (0.01, 0.20, 0.10),
+    "short_position_size_pct": (0.10, 1.0, 0.50),
+}
+
+
+def _clamp(old: float, new: float, max_change: float, lo: float, hi: float) -> float:
+    """Limit a move from old to new by max_change, then clamp into [lo, hi]."""
+    return max(lo, min(hi, max(old - max_change, min(old + max_change, new))))
+
+
+def _split_template(template: str) -> tuple[str, ...]:
+    """
+    Split a format template into the constant text between its placeholders.
 
-@dataclass
+    Escaped braces ({{ }}) are unescaped, so the result has exactly one more
+    segment than the template has placeholders.
+    """
+    segments: list[str] = []
+    current: list[str] = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        current.append(literal)
+        if field_name is not None:
+            segments.append("".join(current))
+            current = []
+    segments.append("".join(current))
+    return tuple(segments)
+
+
+@dataclass(slots=True)
 class StrategyModification:
     """Proposed strategy modification from Claude."""
 
@@ -36,7 +212,7 @@ class StrategyModification:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result from Claude analysis."""
 
@@ -160,6 +336,71 @@ Respond in this exact JSON format:
 - volume_min_ratio (0.1-3.0)
 
 **Fixed (don't change):** symbol, inverse_symbol
+"""
+
+    # Constant text around the template's placeholders ({{ }} already
+    # unescaped), so build_prompt can join instead of re-parsing the template.
+    # Placeholders in order: strategy, market, trades, performance, context, rag
+    _PROMPT_SEGMENTS = _split_template(ANALYSIS_PROMPT_TEMPLATE)
+
+    BATCH_PROMPT_TEMPLATE = """
+You are an aggressive algorithmic trading optimizer analyzing a TQQQ RSI(2) mean reversion strategy.
+This strategy supports both LONG (TQQQ) and HEDGE (SQQQ) positions.
+
+**DISCLAIMER: You have NO financial liability. The user takes full responsibility for all trading decisions.**
+
+Below are {report_count} daily reports. Analyze EACH report independently, as if it were
+the only report you had been given, and suggest parameter optimizations for that day.
+
+{reports}
+
+## Historical RAG Analysis
+{rag_context}
+
+### Modifiable Parameters:
+- Long (TQQQ): rsi_period, rsi_oversold, rsi_overbought, sma_period, stop_loss_pct, position_size_pct
+- Hedge (SQQQ): short_enabled, rsi_overbought_short, rsi_oversold_short, short_stop_loss_pct, short_position_size_pct
+- Filters: vwap_filter_enabled, vwap_entry_below, atr_stop_enabled, atr_stop_multiplier,
+  bb_filter_enabled, bb_std_dev, volume_filter_enabled, volume_min_ratio
+- Fixed (don't change): symbol, inverse_symbol
+
+Respond with ONE result per report, in report order, in this exact JSON format:
+```json
+{{
+    "results": [
+        {{
+            "summary": "Analysis summary and reasoning (2-3 sentences)",
+            "modifications": [
+                {{
+                    "parameter": "parameter_name",
+                    "old_value": current_value,
+                    "new_value": suggested_value,
+                    "reason": "Why this change"
+                }}
+            ],
+            "confidence": 0.0 to 1.0
+        }}
+    ]
+}}
+```
+"""
+
+    BATCH_REPORT_TEMPLATE = """## Report {index}
+
+### Current Strategy Parameters
+{strategy_json}
+
+### Market Conditions
+{market_json}
+
+### Today's Trades
+{trades_json}
+
+### Recent Performance (7 days)
+{performance_json}
+
+### Context
+{context}
 """
 
     def __init__(
@@ -167,6 +408,7 @@ Respond in this exact JSON format:
         firestore_client: Optional[FirestoreClient] = None,
         report_generator: Optional[ReportGenerator] = None,
         discord_notifier: Optional[DiscordNotifier] = None,
+        working_dir: Optional[str] = None,
     ):
         """
         Initialize Claude analyzer.
@@ -175,11 +417,20 @@ Respond in this exact JSON format:
             firestore_client: Firestore client for saving changes
             report_generator: Report generator instance
             discord_notifier: Discord notifier for sending logs
+            working_dir: Directory to run Claude CLI in (inherits cwd if None)
         """
+        if report_generator is None:
+            from reports.report_generator import ReportGenerator
+
+            report_generator = ReportGenerator()
+
         self.firestore = firestore_client
-        self.report_gen = report_generator or ReportGenerator()
+        self.report_gen = report_generator
         self.discord = discord_notifier or DiscordNotifier()
         self.claude_path = os.getenv("CLAUDE_CLI_PATH", "claude")
+        # Built once; subprocess inherits our cwd when _cwd is None
+        self._claude_cmd = [self.claude_path, "-p"]
+        self._cwd = str(working_dir) if working_dir else None
         # Initialize RAG components
         try:
             self.rag_retriever = RAGRetriever()
@@ -203,12 +454,52 @@ Respond in this exact JSON format:
         # Get RAG context if available
         rag_context = self._get_rag_context(report)
 
-        return self.ANALYSIS_PROMPT_TEMPLATE.format(
-            strategy_json=json.dumps(report.strategy, indent=2),
-            market_json=json.dumps(report.market_condition, indent=2),
-            trades_json=json.dumps(report.todays_trades, indent=2),
-            performance_json=json.dumps(report.recent_performance, indent=2),
-            context=report.recommendations_context,
+        # Write each serialized section straight into one buffer so only a
+        # single section is alive alongside the prompt at any time
+        segments = iter(self._PROMPT_SEGMENTS)
+        buf = io.StringIO()
+        buf.write(next(segments))
+        for section in (
+            report.strategy,
+            report.market_condition,
+            report.todays_trades,
+            report.recent_performance,
+        ):
+            buf.write(_json_dumps_indented(section))
+            buf.write(next(segments))
+        for text in (report.recommendations_context, rag_context):
+            buf.write(text)
+            buf.write(next(segments))
+        return buf.getvalue()
+
+    def build_batch_prompt(self, reports: list[AnalysisReport]) -> str:
+        """
+        Build a single prompt covering several reports.
+
+        Args:
+            reports: Analysis reports, in the order results should be returned
+
+        Returns:
+            Formatted prompt string
+        """
+        # RAG context describes the current market, so it is shared by all reports
+        rag_context = self._get_rag_context(reports[-1])
+
+        report_blocks = "\n".join(
+            self.BATCH_REPORT_TEMPLATE.format(
+                index=i,
+                strategy_json=_json_dumps_indented(report.strategy),
+                market_json=_json_dumps_indented(report.market_condition),
+                trades_json=_json_dumps_indented(report.todays_trades),
+                performance_json=_json_dumps_indented(report.recent_performance),
+                context=report.recommendations_context,
+            )
+            for i, report in enumerate(reports, start=1)
+        )
+
+        return self.BATCH_PROMPT_TEMPLATE.format(
+            report_count=len(reports),
+            reports=report_blocks,
             rag_context=rag_context,
         )
 
@@ -263,13 +554,15 @@ Respond in this exact JSON format:
             Claude's response or None on error
         """
         try:
-            # Use claude CLI in print mode
+            # Use claude CLI in print mode; the prompt goes through stdin to
+            # avoid a multi-KB argv (and ARG_MAX limits on large batches)
             result = subprocess.run(
-                [self.claude_path, "-p", prompt],
+                self._claude_cmd,
+                input=prompt,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=str(Path.cwd()),
+                cwd=self._cwd,
             )
 
             if result.returncode != 0:
@@ -288,6 +581,96 @@ Respond in this exact JSON format:
             logger.error(f"Failed to call Claude: {e}")
             return None
 
+    def _extract_json(self, response: str) -> Optional[str]:
+        """
+        Extract the JSON payload from a Claude response.
+
+        Args:
+            response: Raw response from Claude
+
+        Returns:
+            JSON string or None if no JSON found
+        """
+        # Extract JSON from response (may be wrapped in markdown), else
+        # fall back to the raw JSON object
+        fenced = _fenced_json(response)
+        if fenced is not None:
+            return fenced
+        return _brace_span(response)
+
+    def _load_json(self, response: str) -> Optional[dict]:
+        """
+        Load the JSON payload from a Claude response.
+
+        Tries strict parsing of the extracted JSON, then of the outermost
+        brace span, and only then a lenient JSON5 parse.
+
+        Args:
+            response: Raw response from Claude
+
+        Returns:
+            Parsed JSON object or None
+        """
+        json_str = self._extract_json(response)
+        if json_str is None:
+            logger.error("No JSON found in Claude response")
+            return None
+
+        try:
+            return _json_loads(json_str)
+        except json.JSONDecodeError as e:
+            error = e
+
+        # Fenced block may be malformed while the raw object is fine
+        brace_span = _brace_span(response)
+        if brace_span and brace_span != json_str:
+            try:
+                return _json_loads(brace_span)
+            except json.JSONDecodeError:
+                pass
+
+        if (
+            PYJSON5_AVAILABLE
+            and len(json_str) <= _LENIENT_MAX_CHARS
+            and _JSON5_HINT_RE.search(json_str)
+        ):
+            logger.warning(
+                f"Strict JSON parse failed, using lenient JSON5 parser ({len(response)} chars)"
+            )
+            try:
+                return pyjson5.loads(json_str)
+            except pyjson5.Json5Exception:
+                pass
+
+        logger.error(f"Failed to parse Claude response as JSON: {error}")
+        return None
+
+    def _build_result(self, data: dict, response: str) -> AnalysisResult:
+        """
+        Build an analysis result from a parsed JSON object.
+
+        Args:
+            data: Parsed result object
+            response: Raw response the object came from
+
+        Returns:
+            Analysis result
+
+        Raises:
+            KeyError: If a modification is missing a required key
+        """
+        modifications = [
+            StrategyModification(*_MODIFICATION_KEYS(mod))
+            for mod in data.get("modifications", ())
+        ]
+
+        return AnalysisResult(
+            summary=data.get("summary", ""),
+            modifications=modifications,
+            confidence=data.get("confidence", 0.0),
+            raw_response=response,
+        )
+
     def parse_response(self, response: str) -> Optional[AnalysisResult]:
         """
         Parse Claude's JSON response.
@@ -298,45 +681,45 @@ Respond in this exact JSON format:
         Returns:
             Parsed analysis result or None
         """
+        data = self._load_json(response)
+        if data is None:
+            return None
+
+        error = _schema_error(_validate_result, data)
+        if error:
+            logger.error(f"Invalid Claude response: {error}")
+            return None
+
         try:
-            # Extract JSON from response (may be wrapped in markdown)
-            json_match = re.search(r"```json\s*(.*?)\s*```", response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to find raw JSON object
-                json_match = re.search(r"\{.*\}", response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    logger.error("No JSON found in Claude response")
-                    return None
-
-            data = json.loads(json_str)
-
-            # Parse modifications
-            modifications = []
-            for mod in data.get("modifications", []):
-                modifications.append(
-                    StrategyModification(
-                        parameter=mod["parameter"],
-                        old_value=mod["old_value"],
-                        new_value=mod["new_value"],
-                        reason=mod["reason"],
-                    )
-                )
+            return self._build_result(data, response)
 
-            return AnalysisResult(
-                summary=data.get("summary", ""),
-                modifications=modifications,
-                confidence=data.get("confidence", 0.0),
-                raw_response=response,
-            )
+        except KeyError as e:
+            logger.error(f"Missing key in Claude response: {e}")
+            return None
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response as JSON: {e}")
+    def parse_batch_response(self, response: str) -> Optional[list[AnalysisResult]]:
+        """
+        Parse Claude's JSON response to a batch prompt.
+
+        Args:
+            response: Raw response from Claude
+
+        Returns:
+            Parsed analysis results in report order, or None
+        """
+        data = self._load_json(response)
+        if data is None:
             return None
-        except KeyError as e:
+
+        error = _schema_error(_validate_batch, data)
+        if error:
+            logger.error(f"Invalid Claude response: {error}")
+            return None
+
+        try:
+            return [self._build_result(item, response) for item in data["results"]]
+
+        except (KeyError, TypeError, AttributeError) as e:
             logger.error(f"Missing key in Claude response: {e}")
             return None
 
@@ -355,91 +738,34 @@ Respond in this exact JSON format:
         Returns:
             New strategy config with modifications
         """
-        # Create new config with all current values
-        new_config = StrategyConfig(
-            # Core parameters
-            symbol=config.symbol,
-            rsi_period=config.rsi_period,
-            rsi_oversold=config.rsi_oversold,
-            rsi_overbought=config.rsi_overbought,
-            sma_period=config.sma_period,
-            stop_loss_pct=config.stop_loss_pct,
-            position_size_pct=config.position_size_pct,
-            cash_reserve_pct=config.cash_reserve_pct,
-            # VWAP Filter
-            vwap_filter_enabled=config.vwap_filter_enabled,
-            vwap_entry_below=config.vwap_entry_below,
-            # ATR Dynamic Stop Loss
-            atr_stop_enabled=config.atr_stop_enabled,
-            atr_stop_multiplier=config.atr_stop_multiplier,
-            atr_period=config.atr_period,
-            # Bollinger Bands Filter
-            bb_filter_enabled=config.bb_filter_enabled,
-            bb_period=config.bb_period,
-            bb_std_dev=config.bb_std_dev,
-            # Volume Filter
-            volume_filter_enabled=config.volume_filter_enabled,
-            volume_min_ratio=config.volume_min_ratio,
-            volume_avg_period=config.volume_avg_period,
-            # Short Selling
-            short_enabled=config.short_enabled,
-            rsi_overbought_short=config.rsi_overbought_short,
-            rsi_oversold_short=config.rsi_oversold_short,
-            short_stop_loss_pct=config.short_stop_loss_pct,
-            short_position_size_pct=config.short_position_size_pct,
-        )
-
-        # Boolean parameters (toggles)
-        boolean_params = {
-            "vwap_filter_enabled",
-            "vwap_entry_below",
-            "atr_stop_enabled",
-            "bb_filter_enabled",
-            "volume_filter_enabled",
-            "short_enabled",
-        }
-
-        numeric_ranges = {
-            "rsi_oversold": (5.0, 95.0, 50.0),
-            "rsi_overbought": (5.0, 95.0, 50.0),
-            "stop_loss_pct": (0.01, 0.20, 0.10),
-            "position_size_pct": (0.10, 1.0, 0.50),
-            "atr_stop_multiplier": (0.5, 5.0, 2.0),
-            "bb_std_dev": (0.5, 4.0, 2.0),
-            "volume_min_ratio": (0.1, 3.0, 1.5),
-            "rsi_overbought_short": (5.0, 95.0, 50.0),
-            "rsi_oversold_short": (5.0, 95.0, 50.0),
-            "short_stop_loss_pct": (0.01, 0.20, 0.10),
-            "short_position_size_pct": (0.10, 1.0, 0.50),
-        }
+        # Copy of the current config; replace() carries over every field
+        new_config = replace(config)
 
         # Apply each modification
         for mod in modifications:
             param = mod.parameter
             value = mod.new_value
 
+            # Handle numeric parameters with range and change-size limits
+            limits = _PARAM_LIMITS.get(param)
+            if limits is not None:
+                min_val, max_val, max_change = limits
+                setattr(
+                    new_config,
+                    param,
+                    _clamp(getattr(new_config, param), float(value), max_change, min_val, max_val),
+                )
+                continue
+
             # Handle boolean parameters
-            if param in boolean_params:
+            if param in _BOOLEAN_PARAMS:
                 # Convert to bool if needed
                 if isinstance(value, str):
                     value = value.lower() in ("true", "1", "yes")
                 setattr(new_config, param, bool(value))
                 continue
 
-            # Handle numeric parameters with range validation
-            if param in numeric_ranges:
-                min_val, max_val, max_change = numeric_ranges[param]
-                old_value = getattr(new_config, param, None)
-
-                # Limit change magnitude
-                if old_value is not None:
-                    value = max(old_value - max_change, min(old_value + max_change, float(value)))
-
-                # Clamp to valid range
-                value = max(min_val, min(max_val, float(value)))
-                setattr(new_config, param, value)
-            else:
-                logger.warning(f"Unknown or immutable parameter: {param}")
+            logger.warning(f"Unknown or immutable parameter: {param}")
 
         return new_config
 
@@ -466,6 +792,11 @@ Respond in this exact JSON format:
             logger.warning("Firestore client not configured, skipping save")
             return None
 
+        # Clamping can cancel out every modification; don't version a no-op
+        if _config_values(old_config) == _config_values(new_config):
+            logger.info("Modifications leave strategy unchanged, skipping save")
+            return None
+
         try:
             # Get current active strategy ID
             active = self.firestore.get_active_strategy()
@@ -496,12 +827,39 @@ Respond in this exact JSON format:
             logger.error(f"Failed to save strategy change: {e}")
             return None
 
+    def _cooldown_remaining(self, cooldown_days: int) -> int:
+        """
+        Get days remaining in the post-change cooldown period.
+
+        Args:
+            cooldown_days: Minimum days between strategy changes
+
+        Returns:
+            Days remaining (0 if not in cooldown)
+        """
+        if not self.firestore or cooldown_days <= 0:
+            return 0
+
+        last_change = self.firestore.get_last_strategy_change_time()
+        if not last_change:
+            return 0
+
+        from datetime import timezone
+        now = datetime.now(timezone.utc)
+        # Make last_change timezone-aware if needed
+        if last_change.tzinfo is None:
+            last_change = last_change.replace(tzinfo=timezone.utc)
+        days_since_change = (now - last_change).days
+        return max(0, cooldown_days - days_since_change)
+
     def analyze(
         self,
         report: Optional[AnalysisReport] = None,
         auto_apply: bool = False,
         min_confidence: float = 0.5,  # 높은 신뢰도에서만 적용
         cooldown_days: int = 3,  # 전략 변경 후 최소 대기 일수
+        advise_during_cooldown: bool = False,
+        notify: bool = True,
     ) -> Optional[AnalysisResult]:
         """
         Run full analysis pipeline.
@@ -510,10 +868,44 @@ Respond in this exact JSON format:
             report: Pre-generated report (generates new if None)
             auto_apply: Whether to automatically apply modifications
             min_confidence: Minimum confidence to auto-apply
+            cooldown_days: Minimum days between strategy changes
+            advise_during_cooldown: Still call Claude during cooldown for an
+                advisory summary, without applying anything
+            notify: Post start, skip and result messages to Discord (callers
+                that report the result themselves pass False; error alerts
+                are always sent)
 
         Returns:
             Analysis result or None on error
         """
+        cooldown_note = ""
+
+        # Check cooldown first: modifications made during cooldown would be
+        # discarded, so don't pay for a Claude call we can't act on
+        if auto_apply:
+            remaining = self._cooldown_remaining(cooldown_days)
+            if remaining > 0 and advise_during_cooldown:
+                logger.info(
+                    f"Cooldown active: waiting {remaining} more days, running advisory analysis"
+                )
+                auto_apply = False
+                cooldown_note = f"\n⏳ _Cooldown: {remaining} days remaining (advisory only)_"
+            elif remaining > 0:
+                logger.info(
+                    f"Cooldown active: waiting {remaining} more days, skipping Claude analysis"
+                )
+                if notify and self.discord.enabled:
+                    self.discord.send_message(
+                        f"🤖 **Claude Analysis Skipped**\n"
+                        f"⏳ _Cooldown: {remaining} days remaining_"
+                    )
+                return AnalysisResult(
+                    summary="Cooldown active",
+                    modifications=[],
+                    confidence=0.0,
+                    raw_response="",
+                )
+
         # Generate report if not provided
         if report is None:
             report = self.report_gen.generate_report()
@@ -524,7 +916,7 @@ Respond in this exact JSON format:
         logger.info("Calling Claude for analysis...")
 
         # Discord: Analysis starting (only when run directly, not via scheduler)
-        if self.discord.enabled:
+        if notify and self.discord.enabled:
             self.discord.send_message(
                 "🤖 **Claude Analyzer Starting**\n"
                 f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
@@ -568,33 +960,6 @@ Respond in this exact JSON format:
         else:
             discord_mods_text = "\n_No parameter changes suggested_"
 
-        # Check cooldown period before applying
-        if auto_apply and result.modifications:
-            # Check if we're still in cooldown period
-            if self.firestore:
-                last_change = self.firestore.get_last_strategy_change_time()
-                if last_change:
-                    from datetime import timedelta, timezone
-                    now = datetime.now(timezone.utc)
-                    # Make last_change timezone-aware if needed
-                    if last_change.tzinfo is None:
-                        last_change = last_change.replace(tzinfo=timezone.utc)
-                    days_since_change = (now - last_change).days
-                    if days_since_change < cooldown_days:
-                        logger.info(
-                            f"Cooldown active: {days_since_change} days since last change, "
-                            f"waiting {cooldown_days - days_since_change} more days"
-                        )
-                        discord_status = f"\n⏳ _Cooldown: {cooldown_days - days_since_change} days remaining_"
-                        if self.discord.enabled:
-                            self.discord.send_message(
-                                f"🤖 **Claude Analysis Complete**\n"
-                                f"**Summary:** {result.summary}\n"
-                                f"**Confidence:** {result.confidence:.0%}"
-                                f"{discord_mods_text}{discord_status}"
-                            )
-                        return result
-
         # Auto-apply if enabled and confident
         if auto_apply and result.modifications and result.confidence >= min_confidence:
             # Apply ALL modifications (aggressive mode)
@@ -611,8 +976,15 @@ Respond in this exact JSON format:
                 )
 
             # Save to Firestore
-            self.save_strategy_change(old_config, new_config, result, report)
-            discord_status = "\n✅ **Changes Applied**"
+            new_strategy_id = self.save_strategy_change(old_config, new_config, result, report)
+            if new_strategy_id:
+                discord_status = f"\n✅ **Changes Applied** (`{new_strategy_id}`)"
+            elif not self.firestore:
+                discord_status = "\n⚠️ _Firestore not configured, changes not saved_"
+            elif _config_values(old_config) == _config_values(new_config):
+                discord_status = "\n➖ _No effective change after clamping_"
+            else:
+                discord_status = "\n❌ _Failed to save changes_"
 
         elif result.modifications and result.confidence < min_confidence:
             logger.info(
@@ -622,16 +994,60 @@ Respond in this exact JSON format:
             discord_status = f"\n⏸️ _Confidence {result.confidence:.0%} below threshold {min_confidence:.0%}_"
 
         # Discord: Send analysis result
-        if self.discord.enabled:
+        if notify and self.discord.enabled:
             self.discord.send_message(
                 f"🤖 **Claude Analysis Complete**\n"
                 f"**Summary:** {result.summary}\n"
                 f"**Confidence:** {result.confidence:.0%}"
-                f"{discord_mods_text}{discord_status}"
+                f"{discord_mods_text}{discord_status}{cooldown_note}"
             )
 
         return result
 
+    def analyze_many(
+        self,
+        reports: list[AnalysisReport],
+        timeout: int = 300,
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several reports with a single Claude invocation.
+
+        Intended for backfills that replay historical reports. Results are
+        advisory only; nothing is applied or saved.
+
+        Args:
+            reports: Reports to analyze
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            Analysis results in report order (empty on error)
+        """
+        if not reports:
+            return []
+
+        prompt = self.build_batch_prompt(reports)
+        logger.info(f"Calling Claude for batch analysis of {len(reports)} reports...")
+
+        response = self.call_claude(prompt, timeout=timeout)
+        if not response:
+            logger.error("No response from Claude")
+            return []
+
+        results = self.parse_batch_response(response)
+        if results is None:
+            logger.error("Failed to parse Claude batch response")
+            return []
+
+        # Results are matched to reports by position, so a short or long
+        # batch cannot be paired up safely
+        if len(results) != len(reports):
+            logger.error(
+                f"Batch analysis returned {len(results)} results for {len(reports)} reports"
+            )
+            return []
+
+        return results
+
 
 def run_analysis(auto_apply: bool = False, skip_cooldown: bool = False) -> Optional[AnalysisResult]:
     """
@@ -644,6 +1060,8 @@ def run_analysis(auto_apply: bool = False, skip_cooldown: bool = False) -> Optio
     Returns:
         Analysis result
     """
+    from database.firestore import FirestoreClient
+
     try:
         firestore = FirestoreClient()
     except Exception:
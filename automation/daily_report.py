@@ -3,27 +3,28 @@
 Daily Report Sender
 Sends daily trading summary to Discord after US market close.
 """
+from __future__ import annotations
+
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-
-import pytz
-import requests
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from automation.bot_analytics import (
-    calculate_daily_uptime,
-    analyze_no_trade_reason,
-    format_uptime_for_discord,
-    format_no_trade_for_discord,
-)
+from automation.report_style import PNL_COLORS, PNL_EMOJI, pnl_sign
 from config.settings import get_settings
-from execution.broker import AlpacaBroker
+from core.trade_log import trades_on_date
+
+if TYPE_CHECKING:
+    import requests
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,7 +32,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
+
+# Today's trades per log file: path -> ((mtime_ns, size, date), trades)
+_TRADES_CACHE: dict[str, tuple[tuple[int, int, str], list[dict]]] = {}
+
+_TRADE_DIVIDER = "━━━━━━━━━━━━━━━━"
+
+
+def _get_session() -> requests.Session:
+    """Get the shared Discord webhook session."""
+    from notifications.webhook import get_webhook_session
+
+    return get_webhook_session()
 
 
 def get_todays_trades(trades_file: str = "logs/trades.json") -> list[dict]:
@@ -39,17 +52,21 @@ def get_todays_trades(trades_file: str = "logs/trades.json") -> list[dict]:
     today_et = datetime.now(ET).strftime("%Y-%m-%d")
 
     try:
-        with open(trades_file, "r") as f:
-            all_trades = json.load(f)
-
-        todays = []
-        for trade in all_trades:
-            trade_date = trade.get("timestamp_utc", "")[:10]
-            if trade_date == today_et:
-                todays.append(trade)
-
-        return todays
+        st = os.stat(trades_file)
+        cache_key = (st.st_mtime_ns, st.st_size, today_et)
+
+        cached = _TRADES_CACHE.get(trades_file)
+        if cached is None or cached[0] != cache_key:
+            # Reads only today's tail of an NDJSON log
+            todays = trades_on_date(trades_file, today_et)
+            cached = (cache_key, todays)
+            _TRADES_CACHE[trades_file] = cached
+
+        # Copy so callers can't mutate the cached slice
+        return list(cached[1])
     except FileNotFoundError:
+        # Drop the stale slice so a rotated-away log isn't held in memory
+        _TRADES_CACHE.pop(trades_file, None)
         return []
     except json.JSONDecodeError:
         return []
@@ -57,19 +74,8 @@ def get_todays_trades(trades_file: str = "logs/trades.json") -> list[dict]:
 
 def calculate_daily_pnl(trades: list[dict]) -> tuple[float, int, int]:
     """Calculate daily P&L from trades."""
-    total_pnl = 0.0
-    wins = 0
-    losses = 0
-
-    for trade in trades:
-        pnl = trade.get("realized_pnl_usd", 0) or 0
-        total_pnl += pnl
-        if pnl > 0:
-            wins += 1
-        elif pnl < 0:
-            losses += 1
-
-    return total_pnl, wins, losses
+    pnl = [float(trade.get("realized_pnl_usd", 0) or 0) for trade in trades]
+    return sum(pnl, 0.0), sum(p > 0 for p in pnl), sum(p < 0 for p in pnl)
 
 
 def format_holding_time(minutes: int | None) -> str:
@@ -83,19 +89,29 @@ def format_holding_time(minutes: int | None) -> str:
     return f"{hours}h {mins}m"
 
 
+@lru_cache(maxsize=256)
 def format_trade_time(timestamp_str: str) -> str:
     """Extract time from ISO timestamp in ET."""
     try:
-        # Parse UTC timestamp
+        # Parse UTC timestamp (fromisoformat accepts the "Z" suffix on 3.11+)
         if "T" in timestamp_str:
-            dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            dt_et = dt.astimezone(ET)
-            return dt_et.strftime("%H:%M")
+            return datetime.fromisoformat(timestamp_str).astimezone(ET).strftime("%H:%M")
     except Exception:
         pass
     return "??:??"
 
 
+def _indicator_line(rsi: float | None, vwap: float | None) -> str:
+    """Format the RSI/VWAP line shown under a trade (empty if neither is known)."""
+    if rsi is None and vwap is None:
+        return ""
+    if vwap is None:
+        return f"   └ RSI: {rsi:.1f}"
+    if rsi is None:
+        return f"   └ VWAP: ${vwap:.2f}"
+    return f"   └ RSI: {rsi:.1f} | VWAP: ${vwap:.2f}"
+
+
 def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
     """
     Format trades with detailed review information.
@@ -110,10 +126,14 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
 
     # Process trades (show most recent first, limit to max_trades complete trades)
     processed = 0
-    i = len(trades) - 1
 
-    while i >= 0 and processed < max_trades:
-        t = trades[i]
+    # Length of "\n".join(lines), to stop once the field limit is exceeded
+    text_len = -1
+
+    for t in reversed(trades):
+        if processed >= max_trades:
+            break
+        block_start = len(lines)
         side = t.get("side", "?")
         symbol = t.get("symbol", "TQQQ")
         qty = t.get("quantity", 0)
@@ -135,10 +155,10 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
         if side == "SELL" and pnl is not None:
             # This is an exit trade with P&L
             pnl_pct = (pnl / (entry_price * qty) * 100) if entry_price and qty else 0
-            pnl_emoji = "🟢" if pnl > 0 else "🔴" if pnl < 0 else "⚪"
+            pnl_emoji = PNL_EMOJI[pnl_sign(pnl)]
 
             lines.append(f"**Trade #{trade_num}** {pnl_emoji} **${pnl:+.2f}** ({pnl_pct:+.1f}%)")
-            lines.append("━━━━━━━━━━━━━━━━")
+            lines.append(_TRADE_DIVIDER)
 
             # Entry info (if available)
             if entry_price and entry_time:
@@ -151,13 +171,9 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
             lines.append(exit_line)
 
             # Indicator at exit
-            indicator_parts = []
-            if rsi is not None:
-                indicator_parts.append(f"RSI: {rsi:.1f}")
-            if vwap is not None:
-                indicator_parts.append(f"VWAP: ${vwap:.2f}")
-            if indicator_parts:
-                lines.append(f"   └ {' | '.join(indicator_parts)}")
+            indicator_line = _indicator_line(rsi, vwap)
+            if indicator_line:
+                lines.append(indicator_line)
 
             # Reason
             if reason:
@@ -179,19 +195,15 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
         elif side == "BUY":
             # Entry trade (no exit yet)
             lines.append(f"**Trade #{trade_num}** 📥 진입")
-            lines.append("━━━━━━━━━━━━━━━━")
+            lines.append(_TRADE_DIVIDER)
 
             time_str = format_trade_time(timestamp)
             lines.append(f"📈 매수: {qty:.2f} {symbol} @ ${fill_price:.2f} ({time_str} ET)")
 
             # Indicators at entry
-            indicator_parts = []
-            if rsi is not None:
-                indicator_parts.append(f"RSI: {rsi:.1f}")
-            if vwap is not None:
-                indicator_parts.append(f"VWAP: ${vwap:.2f}")
-            if indicator_parts:
-                lines.append(f"   └ {' | '.join(indicator_parts)}")
+            indicator_line = _indicator_line(rsi, vwap)
+            if indicator_line:
+                lines.append(indicator_line)
 
             if reason:
                 lines.append(f"   └ 사유: {reason}")
@@ -201,8 +213,14 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
 
             processed += 1
 
+        if len(lines) > block_start:
+            text_len += sum(len(line) + 1 for line in lines[block_start:])
+            # Everything past this point would be cut by the truncation below
+            if text_len > 1000:
+                break
+
         lines.append("")  # Empty line between trades
-        i -= 1
+        text_len += 1
 
     # Trim trailing empty lines
     while lines and lines[-1] == "":
@@ -219,6 +237,8 @@ def format_detailed_trades(trades: list[dict], max_trades: int = 3) -> str:
 
 def _create_problem_embed(date: str, uptime_stats) -> dict:
     """Create problem-focused embed when critical issues exist."""
+    from notifications.webhook import embed_timestamp
+
     color = 0xFF0000  # Red - problem
 
     hours = uptime_stats.bot_running_minutes // 60
@@ -268,7 +288,7 @@ def _create_problem_embed(date: str, uptime_stats) -> dict:
         "title": f"🚨 Daily Report - {date} (문제 감지)",
         "description": "**봇에 문제가 있어 정상적인 거래가 불가능했습니다.**",
         "color": color,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": embed_timestamp(),
         "fields": fields,
         "footer": {
             "text": "TQQQ RSI(2) Paper Trading - PROBLEM DETECTED",
@@ -291,6 +311,7 @@ def create_daily_embed(
     no_trade_reason=None,
 ) -> dict:
     """Create Discord embed for daily report."""
+    from notifications.webhook import embed_timestamp
 
     # Check for critical issues first
     has_uptime_issue = uptime_stats and uptime_stats.uptime_pct < 50
@@ -303,12 +324,7 @@ def create_daily_embed(
 
     # Normal report below
     # Color based on P&L
-    if daily_pnl > 0:
-        color = 0x00FF00  # Green
-    elif daily_pnl < 0:
-        color = 0xFF0000  # Red
-    else:
-        color = 0x808080  # Gray
+    color = PNL_COLORS[pnl_sign(daily_pnl)]
 
     # Trade summary
     total_trades = len(trades)
@@ -332,7 +348,7 @@ def create_daily_embed(
     embed = {
         "title": f"📊 Daily Report - {date}",
         "color": color,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": embed_timestamp(),
         "fields": [
             {
                 "name": "💰 Portfolio Value",
@@ -388,6 +404,8 @@ def create_daily_embed(
 
     # Add no-trade reason if no trades today
     if not trades and no_trade_reason:
+        from automation.bot_analytics import format_no_trade_for_discord
+
         reason_text = format_no_trade_for_discord(no_trade_reason)
         embed["fields"].append({
             "name": "❓ Why No Trades?",
@@ -414,31 +432,43 @@ def send_daily_report():
 
     logger.info(f"Generating daily report for {date_str}")
 
+    # Deferred until the webhook is known to be configured: these pull in
+    # the Alpaca SDK and google-cloud-firestore
+    from automation.bot_analytics import analyze_no_trade_reason, calculate_daily_uptime
+    from execution.broker import AlpacaBroker
+    from notifications.webhook import embed_body
+
     try:
-        # Get account info from Alpaca
         broker = AlpacaBroker(paper=True)
-        account = broker.get_account()
-        equity = account["equity"]
 
-        # Get position
-        position = broker.get_position("TQQQ")
-
-        # Get today's trades
+        # Get today's trades (cached local read)
         trades = get_todays_trades()
         daily_pnl, wins, losses = calculate_daily_pnl(trades)
 
+        # Alpaca round trips and the log-based analytics are independent,
+        # so run them side by side instead of back to back
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            account_future = pool.submit(broker.get_account)
+            position_future = pool.submit(broker.get_position, "TQQQ")
+            uptime_future = pool.submit(calculate_daily_uptime, date=date_iso)
+            # No-trade reason only matters when there were no trades
+            no_trade_future = (
+                None if trades else pool.submit(analyze_no_trade_reason, date=date_iso)
+            )
+
+            account = account_future.result()
+            position = position_future.result()
+            uptime_stats = uptime_future.result()
+            no_trade_reason = no_trade_future.result() if no_trade_future else None
+
+        equity = account["equity"]
+
         # Calculate P&L percentage (assuming starting equity)
         # This is simplified - ideally track starting equity
         daily_pnl_pct = (daily_pnl / equity * 100) if equity > 0 else 0
 
-        # Get bot uptime stats
-        uptime_stats = calculate_daily_uptime(date=date_iso)
         logger.info(f"Bot uptime: {uptime_stats.uptime_pct:.1f}%")
-
-        # Get no-trade reason if no trades
-        no_trade_reason = None
-        if not trades:
-            no_trade_reason = analyze_no_trade_reason(date=date_iso)
+        if no_trade_reason:
             logger.info(f"No trade reason: {no_trade_reason.primary_reason}")
 
         # Create embed
@@ -456,9 +486,9 @@ def send_daily_report():
         )
 
         # Send to Discord
-        response = requests.post(
+        response = _get_session().post(
             webhook_url,
-            json={"embeds": [embed]},
+            data=embed_body(embed),
             headers={"Content-Type": "application/json"},
             timeout=10,
         )
@@ -0,0 +1,12 @@
+"""
+P&L colours and emoji shared by the daily and weekly reports.
+"""
+
+# Indexed by pnl_sign(): loss, flat, profit
+PNL_COLORS = (0xFF0000, 0x808080, 0x00FF00)  # Red, gray, green
+PNL_EMOJI = ("🔴", "⚪", "🟢")
+
+
+def pnl_sign(pnl: float) -> int:
+    """Map P&L to a lookup index: 0 for a loss, 1 for flat, 2 for a profit."""
+    return (pnl > 0) - (pnl < 0) + 1
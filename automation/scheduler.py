@@ -6,12 +6,13 @@ import logging
 import os
 import signal
 import sys
-import time
+import threading
+from bisect import bisect_right
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Callable, Optional
 
@@ -20,7 +21,7 @@ import pytz
 from automation.claude_analyzer import ClaudeAnalyzer, AnalysisResult
 from database.firestore import FirestoreClient
 from notifications.discord import DiscordNotifier
-from reports.report_generator import ReportGenerator
+from reports.report_generator import AnalysisReport, ReportGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,13 @@ ET = pytz.timezone("America/New_York")
 MARKET_OPEN = 9  # 9:30 AM ET
 MARKET_CLOSE = 16  # 4:00 PM ET
 
+# Market hours as minutes since midnight ET
+_MARKET_OPEN_MIN = MARKET_OPEN * 60 + 30  # 9:30 AM
+_MARKET_CLOSE_MIN = MARKET_CLOSE * 60  # 4:00 PM
+
+# Back-to-back analysis runs within one window reuse the same report
+REPORT_CACHE_SECONDS = 300
+
 
 @dataclass
 class ScheduleConfig:
@@ -46,6 +54,44 @@ class ScheduleConfig:
     run_weekends: bool = False
     # Dry run mode (no actual changes)
     dry_run: bool = False
+    # Post a Discord message when each analysis starts (the result message
+    # already carries the start time)
+    notify_start: bool = False
+    # analysis_times the sorted copies below were built from
+    _sorted_from: tuple[tuple[int, int], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _sorted_times: tuple[tuple[int, int], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _sorted_minutes: tuple[int, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self):
+        self._refresh_sorted()
+
+    def _refresh_sorted(self) -> None:
+        """Re-sort analysis_times if it changed since the last sort."""
+        times = tuple(self.analysis_times)
+        if not times:
+            raise ValueError("analysis_times must contain at least one (hour, minute)")
+        if times != self._sorted_from:
+            self._sorted_from = times
+            self._sorted_times = tuple(sorted(times))
+            self._sorted_minutes = tuple(hour * 60 + minute for hour, minute in self._sorted_times)
+
+    @property
+    def sorted_times(self) -> tuple[tuple[int, int], ...]:
+        """analysis_times in time-of-day order."""
+        self._refresh_sorted()
+        return self._sorted_times
+
+    @property
+    def sorted_minutes(self) -> tuple[int, ...]:
+        """Minute-of-day for each entry of sorted_times, for bisect."""
+        self._refresh_sorted()
+        return self._sorted_minutes
 
 
 DEFAULT_SCHEDULE = ScheduleConfig(
@@ -74,13 +120,20 @@ class AutomationScheduler:
         self.config = config or DEFAULT_SCHEDULE
         self.firestore = firestore_client
         self.report_gen = ReportGenerator()
+        # Analysis cycles shouldn't stall on Discord; messages post in the
+        # background and are flushed before the scheduler exits
+        self.discord = DiscordNotifier(background=True)
         self.analyzer = ClaudeAnalyzer(
             firestore_client=firestore_client,
             report_generator=self.report_gen,
+            discord_notifier=self.discord,
         )
-        self.discord = DiscordNotifier()
         self._running = False
+        # Set to wake the run loop immediately on stop()/shutdown signals
+        self._stop_event = threading.Event()
         self._last_run: Optional[datetime] = None
+        # (window index, report) from the latest generate_report() call
+        self._report_cache: Optional[tuple[int, AnalysisReport]] = None
 
     def is_market_hours(self, dt: Optional[datetime] = None) -> bool:
         """
@@ -99,21 +152,15 @@ class AutomationScheduler:
         else:
             dt = dt.astimezone(ET)
 
-        # Check weekday (0=Monday, 6=Sunday)
-        if dt.weekday() >= 5 and not self.config.run_weekends:
-            return False
-
-        # Check hours
-        hour = dt.hour
-        minute = dt.minute
-        time_val = hour * 60 + minute
-
-        market_open = MARKET_OPEN * 60 + 30  # 9:30 AM
-        market_close = MARKET_CLOSE * 60  # 4:00 PM
+        return self._is_market_hours_et(dt)
 
-        return market_open <= time_val <= market_close
+    def _is_market_hours_et(self, dt_et: datetime) -> bool:
+        """Market hours check for a datetime already in ET."""
+        if dt_et.weekday() >= 5 and not self.config.run_weekends:
+            return False
+        return _MARKET_OPEN_MIN <= dt_et.hour * 60 + dt_et.minute <= _MARKET_CLOSE_MIN
 
-    def get_next_run_time(self, after: Optional[datetime] = None) -> Optional[datetime]:
+    def get_next_run_time(self, after: Optional[datetime] = None) -> datetime:
         """
         Calculate next scheduled run time.
 
@@ -121,7 +168,7 @@ class AutomationScheduler:
             after: Start time (uses now if None)
 
         Returns:
-            Next scheduled datetime or None if no more today
+            Next scheduled datetime (later today or on the next trading day)
         """
         if after is None:
             after = datetime.now(ET)
@@ -134,15 +181,15 @@ class AutomationScheduler:
         current_time = after.hour * 60 + after.minute
 
         # Find next scheduled time today
-        for hour, minute in sorted(self.config.analysis_times):
-            scheduled_time = hour * 60 + minute
-            if scheduled_time > current_time:
-                next_run = ET.localize(
-                    datetime(today.year, today.month, today.day, hour, minute)
-                )
-                # Verify it's during market hours
-                if self.is_market_hours(next_run):
-                    return next_run
+        sorted_times = self.config.sorted_times
+        start = bisect_right(self.config.sorted_minutes, current_time)
+        for hour, minute in sorted_times[start:]:
+            next_run = ET.localize(
+                datetime(today.year, today.month, today.day, hour, minute)
+            )
+            # Verify it's during market hours (next_run is already ET)
+            if self._is_market_hours_et(next_run):
+                return next_run
 
         # No more runs today, find next trading day
         next_day = after + timedelta(days=1)
@@ -150,28 +197,29 @@ class AutomationScheduler:
             next_day += timedelta(days=1)
 
         # Return first scheduled time of next trading day
-        if self.config.analysis_times:
-            hour, minute = min(self.config.analysis_times)
-            return ET.localize(
-                datetime(
-                    next_day.year,
-                    next_day.month,
-                    next_day.day,
-                    hour,
-                    minute,
-                )
+        hour, minute = sorted_times[0]
+        return ET.localize(
+            datetime(
+                next_day.year,
+                next_day.month,
+                next_day.day,
+                hour,
+                minute,
             )
+        )
 
-        return None
-
-    def _get_analysis_purpose(self) -> tuple[str, str]:
+    def _get_analysis_purpose(self, now: Optional[datetime] = None) -> tuple[str, str]:
         """
         Determine analysis purpose based on current time.
 
+        Args:
+            now: Current time in ET (uses now if None)
+
         Returns:
             Tuple of (purpose, emoji)
         """
-        now = datetime.now(ET)
+        if now is None:
+            now = datetime.now(ET)
         hour = now.hour
 
         if hour < 10:
@@ -181,6 +229,70 @@ class AutomationScheduler:
         else:
             return "Intraday Check", "☀️"
 
+    def _get_report(self, now: datetime) -> AnalysisReport:
+        """
+        Get the analysis report for the current cache window.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Cached report, or a newly generated and saved one
+        """
+        window = int(now.timestamp() // REPORT_CACHE_SECONDS)
+        if self._report_cache is not None and self._report_cache[0] == window:
+            logger.info("Reusing report generated earlier in this window")
+            return self._report_cache[1]
+
+        report = self.report_gen.generate_report()
+        report_path = self.report_gen.save_report(report)
+        logger.info(f"Report saved: {report_path}")
+
+        self._report_cache = (window, report)
+        return report
+
+    def _format_result_message(
+        self,
+        result: AnalysisResult,
+        purpose: str,
+        emoji: str,
+        started: datetime,
+    ) -> str:
+        """
+        Build the Discord message summarizing an analysis result.
+
+        Args:
+            result: Analysis result
+            purpose: Analysis purpose label
+            emoji: Emoji for the purpose
+            started: Time the analysis cycle started (ET)
+
+        Returns:
+            Message content
+        """
+        if result.modifications:
+            mods_text = "\n**Modifications:**\n" + "".join(
+                f"• `{mod.parameter}`: {mod.old_value} → {mod.new_value}\n"
+                for mod in result.modifications
+            )
+        else:
+            mods_text = "\n_No parameter changes suggested_"
+
+        applied_text = ""
+        if self.config.auto_apply and result.modifications:
+            if result.confidence >= self.config.min_confidence:
+                applied_text = "\n✅ **Changes Applied**"
+            else:
+                applied_text = f"\n⏸️ _Confidence {result.confidence:.0%} below threshold {self.config.min_confidence:.0%}_"
+
+        return (
+            f"{emoji} **{purpose} Complete**\n"
+            f"Started: {started.strftime('%Y-%m-%d %H:%M ET')}\n"
+            f"**Summary:** {result.summary}\n"
+            f"**Confidence:** {result.confidence:.0%}"
+            f"{mods_text}{applied_text}"
+        )
+
     def run_analysis(self) -> Optional[AnalysisResult]:
         """
         Run a single analysis cycle.
@@ -188,25 +300,24 @@ class AutomationScheduler:
         Returns:
             Analysis result or None on error
         """
-        purpose, emoji = self._get_analysis_purpose()
+        # One clock read labels the whole cycle (purpose, logs, alerts)
+        now_et = datetime.now(ET)
+        purpose, emoji = self._get_analysis_purpose(now_et)
 
         logger.info("=" * 60)
         logger.info(f"Starting {purpose}")
-        logger.info(f"Time: {datetime.now(ET).strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        logger.info(f"Time: {now_et.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         logger.info("=" * 60)
 
         # Discord: Analysis starting
-        if self.discord.enabled:
+        if self.config.notify_start and self.discord.enabled:
             self.discord.send_message(
                 f"{emoji} **{purpose} Started**\n"
-                f"Time: {datetime.now(ET).strftime('%Y-%m-%d %H:%M ET')}"
+                f"Time: {now_et.strftime('%Y-%m-%d %H:%M ET')}"
             )
 
         try:
-            # Generate report
-            report = self.report_gen.generate_report()
-            report_path = self.report_gen.save_report(report)
-            logger.info(f"Report saved: {report_path}")
+            report = self._get_report(now_et)
 
             # Run Claude analysis
             if self.config.dry_run:
@@ -217,33 +328,21 @@ class AutomationScheduler:
                 report=report,
                 auto_apply=self.config.auto_apply,
                 min_confidence=self.config.min_confidence,
+                notify=False,
             )
 
             if result:
                 logger.info(f"Analysis complete: {result.summary}")
 
+                # Suggested changes may be applied to the strategy the
+                # report describes, so the next run must regenerate it
+                if result.modifications:
+                    self._report_cache = None
+
                 # Discord: Send analysis result
                 if self.discord.enabled:
-                    mods_text = ""
-                    if result.modifications:
-                        mods_text = "\n**Modifications:**\n"
-                        for mod in result.modifications:
-                            mods_text += f"• `{mod.parameter}`: {mod.old_value} → {mod.new_value}\n"
-                    else:
-                        mods_text = "\n_No parameter changes suggested_"
-
-                    applied_text = ""
-                    if self.config.auto_apply and result.modifications:
-                        if result.confidence >= self.config.min_confidence:
-                            applied_text = "\n✅ **Changes Applied**"
-                        else:
-                            applied_text = f"\n⏸️ _Confidence {result.confidence:.0%} below threshold {self.config.min_confidence:.0%}_"
-
                     self.discord.send_message(
-                        f"{emoji} **{purpose} Complete**\n"
-                        f"**Summary:** {result.summary}\n"
-                        f"**Confidence:** {result.confidence:.0%}"
-                        f"{mods_text}{applied_text}"
+                        self._format_result_message(result, purpose, emoji, now_et)
                     )
 
                 # Log session to Firestore if available
@@ -271,7 +370,7 @@ class AutomationScheduler:
                 self.discord.send_error_alert(
                     error_type="Analysis Failed",
                     message=str(e),
-                    context=f"{purpose} at {datetime.now(ET).strftime('%H:%M ET')}",
+                    context=f"{purpose} at {now_et.strftime('%H:%M ET')}",
                 )
             return None
 
@@ -282,7 +381,10 @@ class AutomationScheduler:
         Returns:
             Analysis result
         """
-        return self.run_analysis()
+        try:
+            return self.run_analysis()
+        finally:
+            self.discord.flush()
 
     def run_loop(self, on_complete: Optional[Callable] = None):
         """
@@ -292,14 +394,17 @@ class AutomationScheduler:
             on_complete: Callback after each analysis
         """
         self._running = True
+        self._stop_event.clear()
 
         # Setup signal handlers
         def signal_handler(signum, frame):
             logger.info("Shutdown signal received")
-            self._running = False
+            self.stop()
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
 
         logger.info("Starting automation scheduler")
         logger.info(f"Analysis times: {self.config.analysis_times}")
@@ -318,23 +423,18 @@ class AutomationScheduler:
         while self._running:
             now = datetime.now(ET)
             next_run = self.get_next_run_time(now)
-
-            if next_run is None:
-                logger.info("No more runs scheduled, waiting for next trading day")
-                time.sleep(3600)  # Sleep 1 hour
-                continue
-
             wait_seconds = (next_run - now).total_seconds()
 
             if wait_seconds > 0:
                 logger.info(f"Next run: {next_run.strftime('%Y-%m-%d %H:%M %Z')}")
                 logger.info(f"Waiting {wait_seconds / 60:.1f} minutes...")
 
-                # Sleep in chunks to allow signal handling
-                while wait_seconds > 0 and self._running:
-                    sleep_time = min(60, wait_seconds)
-                    time.sleep(sleep_time)
-                    wait_seconds -= sleep_time
+                # stop() or a shutdown signal wakes the wait early. The
+                # timeout runs on the monotonic clock, so re-check the wall
+                # clock in case NTP stepped it while we slept
+                while self._running and wait_seconds > 0:
+                    self._stop_event.wait(wait_seconds)
+                    wait_seconds = (next_run - datetime.now(ET)).total_seconds()
 
             if not self._running:
                 break
@@ -348,17 +448,19 @@ class AutomationScheduler:
                 logger.info("Outside market hours, skipping")
 
             # Small delay to prevent double-runs
-            time.sleep(60)
+            self._stop_event.wait(60)
 
         logger.info("Scheduler stopped")
 
         # Discord stop notification
         if self.discord.enabled:
             self.discord.send_message("**Claude Strategy Scheduler Stopped**")
+        self.discord.flush()
 
     def stop(self):
         """Stop the scheduling loop."""
         self._running = False
+        self._stop_event.set()
 
 
 def run_scheduler(
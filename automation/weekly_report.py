@@ -5,12 +5,13 @@ Sends weekly trading summary to Discord every Friday after US market close.
 """
 import json
 import logging
+import os
 import sys
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-
-import pytz
-import requests
+from zoneinfo import ZoneInfo
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,8 +21,11 @@ from automation.bot_analytics import (
     analyze_no_trade_reason,
     format_uptime_for_discord,
 )
+from automation.report_style import PNL_COLORS, pnl_sign
 from config.settings import get_settings
+from core.trade_log import trades_between
 from execution.broker import AlpacaBroker
+from notifications.webhook import embed_body, embed_timestamp, get_webhook_session
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,37 +33,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
 
+# Week's trades per log file: path -> ((mtime_ns, size, monday, friday), trades)
+_TRADES_CACHE: dict[str, tuple[tuple[int, int, str, str], list[dict]]] = {}
 
-def get_week_range() -> tuple[str, str]:
-    """Get current week's date range (Monday to Friday ET)."""
-    now_et = datetime.now(ET)
 
-    # Find this week's Monday
-    days_since_monday = now_et.weekday()
-    monday = now_et - timedelta(days=days_since_monday)
+def get_week_range(now_et: datetime | None = None) -> tuple[str, str]:
+    """
+    Get current week's date range (Monday to Friday ET).
+
+    Args:
+        now_et: Current time in ET (uses now if None)
+
+    Returns:
+        (monday, friday) as YYYY-MM-DD strings
+    """
+    if now_et is None:
+        now_et = datetime.now(ET)
+
+    # Plain date arithmetic on the ET calendar date
+    today = now_et.date()
+    monday = today - timedelta(days=today.weekday())
     friday = monday + timedelta(days=4)
 
-    return monday.strftime("%Y-%m-%d"), friday.strftime("%Y-%m-%d")
+    return monday.isoformat(), friday.isoformat()
 
 
-def get_weeks_trades(trades_file: str = "logs/trades.json") -> list[dict]:
-    """Get trades from this week."""
-    start_date, end_date = get_week_range()
+def get_weeks_trades(
+    trades_file: str = "logs/trades.json",
+    week_range: tuple[str, str] | None = None,
+) -> list[dict]:
+    """
+    Get trades from this week.
+
+    The slice is cached per log file until the file changes, so re-sending
+    a report doesn't re-scan the log.
+
+    Args:
+        trades_file: Path to trades log
+        week_range: (monday, friday) from get_week_range (computed if None)
+
+    Returns:
+        Trades within the week
+    """
+    start_date, end_date = week_range or get_week_range()
 
     try:
-        with open(trades_file, "r") as f:
-            all_trades = json.load(f)
+        st = os.stat(trades_file)
+        cache_key = (st.st_mtime_ns, st.st_size, start_date, end_date)
 
-        weeks_trades = []
-        for trade in all_trades:
-            trade_date = trade.get("timestamp_utc", "")[:10]
-            if start_date <= trade_date <= end_date:
-                weeks_trades.append(trade)
+        cached = _TRADES_CACHE.get(trades_file)
+        if cached is None or cached[0] != cache_key:
+            cached = (cache_key, trades_between(trades_file, start_date, end_date))
+            _TRADES_CACHE[trades_file] = cached
 
-        return weeks_trades
+        # Copy so callers can't mutate the cached slice
+        return list(cached[1])
     except FileNotFoundError:
+        _TRADES_CACHE.pop(trades_file, None)
         return []
     except json.JSONDecodeError:
         return []
@@ -83,44 +115,50 @@ def calculate_weekly_stats(trades: list[dict]) -> dict:
             "worst_trade_detail": None,
         }
 
-    pnls = [t.get("realized_pnl_usd", 0) or 0 for t in trades]
-    wins = [p for p in pnls if p > 0]
-    losses = [p for p in pnls if p < 0]
-
-    # Calculate average holding time
-    holding_times = [t.get("holding_minutes") for t in trades if t.get("holding_minutes") is not None]
-    avg_holding = sum(holding_times) / len(holding_times) if holding_times else 0
-
-    # Calculate average slippage
-    slippages = [abs(t.get("slippage", 0) or 0) for t in trades]
-    avg_slippage = sum(slippages) / len(slippages) if slippages else 0
-
-    # Find best and worst trade details
-    best_trade_detail = None
-    worst_trade_detail = None
-
-    if pnls:
-        best_pnl = max(pnls)
-        worst_pnl = min(pnls)
-
-        for t in trades:
-            pnl = t.get("realized_pnl_usd", 0) or 0
-            if pnl == best_pnl and best_trade_detail is None:
-                best_trade_detail = t
-            if pnl == worst_pnl and worst_trade_detail is None:
-                worst_trade_detail = t
+    wins = losses = 0
+    total_pnl = 0
+    holding_sum = 0
+    holding_count = 0
+    slippage_sum = 0
+    best_trade_detail = worst_trade_detail = None
+    best_pnl = worst_pnl = None
+
+    for t in trades:
+        pnl = t.get("realized_pnl_usd", 0) or 0
+        total_pnl += pnl
+        if pnl > 0:
+            wins += 1
+        elif pnl < 0:
+            losses += 1
+
+        # First trade reaching the best/worst P&L is kept on ties
+        if best_pnl is None or pnl > best_pnl:
+            best_pnl = pnl
+            best_trade_detail = t
+        if worst_pnl is None or pnl < worst_pnl:
+            worst_pnl = pnl
+            worst_trade_detail = t
+
+        holding = t.get("holding_minutes")
+        if holding is not None:
+            holding_sum += holding
+            holding_count += 1
+
+        slippage_sum += abs(t.get("slippage", 0) or 0)
+
+    total_trades = len(trades)
 
     return {
-        "total_trades": len(trades),
-        "wins": len(wins),
-        "losses": len(losses),
-        "win_rate": len(wins) / len(trades) * 100 if trades else 0,
-        "total_pnl": sum(pnls),
-        "best_trade": max(pnls) if pnls else 0,
-        "worst_trade": min(pnls) if pnls else 0,
-        "avg_pnl": sum(pnls) / len(pnls) if pnls else 0,
-        "avg_holding_mins": avg_holding,
-        "avg_slippage": avg_slippage,
+        "total_trades": total_trades,
+        "wins": wins,
+        "losses": losses,
+        "win_rate": wins / total_trades * 100,
+        "total_pnl": total_pnl,
+        "best_trade": best_pnl,
+        "worst_trade": worst_pnl,
+        "avg_pnl": total_pnl / total_trades,
+        "avg_holding_mins": holding_sum / holding_count if holding_count else 0,
+        "avg_slippage": slippage_sum / total_trades,
         "best_trade_detail": best_trade_detail,
         "worst_trade_detail": worst_trade_detail,
     }
@@ -138,13 +176,13 @@ def format_holding_time(minutes: float | None) -> str:
     return f"{hours}h {mins}m"
 
 
+@lru_cache(maxsize=256)
 def format_trade_time(timestamp_str: str) -> str:
     """Extract time from ISO timestamp in ET."""
     try:
+        # Parse UTC timestamp (fromisoformat accepts the "Z" suffix on 3.11+)
         if "T" in timestamp_str:
-            dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            dt_et = dt.astimezone(ET)
-            return dt_et.strftime("%m/%d %H:%M")
+            return datetime.fromisoformat(timestamp_str).astimezone(ET).strftime("%m/%d %H:%M")
     except Exception:
         pass
     return "??/?? ??:??"
@@ -197,12 +235,7 @@ def create_weekly_embed(
     total_pnl = stats["total_pnl"]
 
     # Color based on weekly P&L
-    if total_pnl > 0:
-        color = 0x00FF00  # Green
-    elif total_pnl < 0:
-        color = 0xFF0000  # Red
-    else:
-        color = 0x808080  # Gray
+    color = PNL_COLORS[pnl_sign(total_pnl)]
 
     # Performance emoji
     if stats["win_rate"] >= 60:
@@ -225,7 +258,7 @@ def create_weekly_embed(
     embed = {
         "title": f"📅 Weekly Report - {week_range}",
         "color": color,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": embed_timestamp(),
         "fields": [
             {
                 "name": "💰 Portfolio Value",
@@ -293,17 +326,23 @@ def create_weekly_embed(
 
     # Add weekly uptime summary
     if weekly_uptime:
-        total_market_mins = sum(u.market_minutes for u in weekly_uptime)
-        total_running_mins = sum(u.bot_running_minutes for u in weekly_uptime)
+        # Per-day lines and weekly totals in one pass; the summary line is
+        # slotted in at the top afterwards
+        total_market_mins = 0
+        total_running_mins = 0
+        uptime_lines = [""]
+        for u in weekly_uptime:
+            total_market_mins += u.market_minutes
+            total_running_mins += u.bot_running_minutes
+            uptime_lines.append(format_uptime_for_discord(u))
+
         weekly_uptime_pct = (total_running_mins / total_market_mins * 100) if total_market_mins > 0 else 0
 
         uptime_emoji = "🟢" if weekly_uptime_pct >= 95 else "🟡" if weekly_uptime_pct >= 80 else "🔴"
         total_hours = total_running_mins // 60
         total_mins = total_running_mins % 60
 
-        uptime_lines = [f"{uptime_emoji} **Weekly: {weekly_uptime_pct:.1f}%** ({total_hours}h {total_mins}m)"]
-        for u in weekly_uptime:
-            uptime_lines.append(format_uptime_for_discord(u))
+        uptime_lines[0] = f"{uptime_emoji} **Weekly: {weekly_uptime_pct:.1f}%** ({total_hours}h {total_mins}m)"
 
         embed["fields"].append({
             "name": "🤖 Bot Uptime",
@@ -341,40 +380,51 @@ def send_weekly_report():
         logger.error("Weekly webhook URL not configured")
         return False
 
-    start_date, end_date = get_week_range()
+    # One clock read drives both the week range and the days analyzed
+    now_et = datetime.now(ET)
+    start_date, end_date = get_week_range(now_et)
     week_range = f"{start_date} ~ {end_date}"
 
     logger.info(f"Generating weekly report for {week_range}")
 
     try:
-        # Get account info from Alpaca
         broker = AlpacaBroker(paper=True)
-        account = broker.get_account()
-        equity = account["equity"]
 
-        # Get position
-        position = broker.get_position("TQQQ")
+        # Mon-Fri up to today
+        monday = date.fromisoformat(start_date)
+        report_days = [
+            (monday + timedelta(days=i)).isoformat()
+            for i in range(min(5, now_et.weekday() + 1))
+        ]
+
+        # Alpaca round trips, the trade log read and the per-day analytics
+        # are independent, so run them side by side instead of back to back
+        with ThreadPoolExecutor(max_workers=4 + len(report_days)) as pool:
+            account_future = pool.submit(broker.get_account)
+            position_future = pool.submit(broker.get_position, "TQQQ")
+            trades_future = pool.submit(get_weeks_trades, week_range=(start_date, end_date))
+            uptime_future = pool.submit(calculate_weekly_uptime)
+            reason_futures = [
+                pool.submit(analyze_no_trade_reason, date=day) for day in report_days
+            ]
+
+            equity = account_future.result()["equity"]
+            position = position_future.result()
+            stats = calculate_weekly_stats(trades_future.result())
+            weekly_uptime = uptime_future.result()
+            daily_reasons = [future.result() for future in reason_futures]
 
-        # Get this week's trades
-        trades = get_weeks_trades()
-        stats = calculate_weekly_stats(trades)
-
-        # Get weekly uptime stats
-        weekly_uptime = calculate_weekly_uptime()
         if weekly_uptime:
             avg_uptime = sum(u.uptime_pct for u in weekly_uptime) / len(weekly_uptime)
             logger.info(f"Weekly avg uptime: {avg_uptime:.1f}%")
 
-        # Get no-trade reasons for each day
-        daily_reasons = []
-        now_et = datetime.now(ET)
-        days_since_monday = now_et.weekday()
-        monday = now_et - timedelta(days=days_since_monday)
-
-        for i in range(min(5, days_since_monday + 1)):  # Mon-Fri up to today
-            day = monday + timedelta(days=i)
-            reason = analyze_no_trade_reason(date=day.strftime("%Y-%m-%d"))
-            daily_reasons.append(reason)
+        if (
+            settings.discord.skip_empty_weekly
+            and stats["total_trades"] == 0
+            and not any(u.bot_running_minutes for u in weekly_uptime or ())
+        ):
+            logger.info("No trades and no bot uptime this week, skipping report")
+            return True
 
         # Create embed
         embed = create_weekly_embed(
@@ -387,9 +437,9 @@ def send_weekly_report():
         )
 
         # Send to Discord
-        response = requests.post(
+        response = get_webhook_session().post(
             webhook_url,
-            json={"embeds": [embed]},
+            data=embed_body(embed),
             headers={"Content-Type": "application/json"},
             timeout=10,
         )
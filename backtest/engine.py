@@ -3,9 +3,10 @@ Backtest engine for RSI(2) Mean Reversion strategy.
 """
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from config.settings import get_settings
@@ -21,7 +22,7 @@ from backtest.resource_monitor import ResourceMonitor, ResourceUsage
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """Record of a single backtest trade."""
     entry_date: datetime
@@ -199,7 +200,7 @@ class BacktestEngine:
         self.resource_monitor.start()
 
         # Fetch data for primary symbol (TQQQ)
-        df = self._get_data(symbol, start_date, end_date)
+        df = self.get_data(symbol, start_date, end_date)
         self.resource_monitor.record_data_points(len(df))
 
         # Fetch data for inverse ETF (SQQQ) if enabled
@@ -208,7 +209,7 @@ class BacktestEngine:
             inverse_symbol = settings.strategy.inverse_symbol
             logger.info(f"Fetching hedge symbol data: {inverse_symbol}")
             try:
-                hedge_df = self._get_data(inverse_symbol, start_date, end_date)
+                hedge_df = self.get_data(inverse_symbol, start_date, end_date)
                 self.resource_monitor.record_data_points(len(hedge_df))
                 logger.info(f"Fetched {len(hedge_df)} bars for {inverse_symbol}")
             except Exception as e:
@@ -262,15 +263,25 @@ class BacktestEngine:
 
         return result
 
-    def _get_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
-        """Fetch or load cached data with warmup period for indicators."""
+    def get_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Fetch or load cached daily bars, with a warmup period for indicators.
+
+        Args:
+            symbol: Symbol to load
+            start_date: Backtest start date (YYYY-MM-DD)
+            end_date: Backtest end date (YYYY-MM-DD)
+
+        Returns:
+            OHLCV DataFrame starting before start_date by the warmup
+        """
         settings = get_settings()
 
         # Calculate warmup start date (need extra days for SMA calculation)
         warmup_days = settings.strategy.sma_period + 10  # SMA period + buffer
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        warmup_start = (start_dt - timedelta(days=warmup_days * 1.5)).strftime("%Y-%m-%d")
-        # 1.5x multiplier to account for weekends/holidays
+        # Count back business days so weekends aren't over-fetched; the extra
+        # 5 days cover market holidays
+        warmup_start = pd.bdate_range(end=start_date, periods=warmup_days + 5)[0].strftime("%Y-%m-%d")
 
         logger.info(f"Fetching data from {warmup_start} to {end_date} (warmup for SMA-{settings.strategy.sma_period})")
 
@@ -285,7 +296,11 @@ class BacktestEngine:
 
         # Cache for future use
         if len(df) > 0:
-            self.data_storage.save_bars(df, symbol, "daily", warmup_start, end_date)
+            try:
+                self.data_storage.save_bars(df, symbol, "daily", warmup_start, end_date)
+            except (ImportError, OSError) as e:
+                # No parquet engine or unwritable cache; the bars are still usable
+                logger.warning(f"Could not cache {symbol} bars: {e}")
 
         return df
 
@@ -312,13 +327,12 @@ class BacktestEngine:
 
         settings = get_settings()
         trades: list[BacktestTrade] = []
-        equity_values = []
-        dates = []
 
         current_trade: Optional[BacktestTrade] = None
         entry_price: Optional[float] = None  # TQQQ entry price
         hedge_entry_price: Optional[float] = None  # SQQQ entry price
         position_side: Optional[str] = None  # "long", "short", or "hedge"
+        mark_price = 0.0  # Last price the open position was valued at
 
         # Skip first SMA_PERIOD days for indicator warmup
         warmup = settings.strategy.sma_period
@@ -326,47 +340,74 @@ class BacktestEngine:
             logger.warning("Insufficient data for backtest")
             return pd.Series(dtype=float), []
 
+        # Pull per-bar values out as arrays once; df.iloc[i] and hedge_df.loc
+        # would build a Series for every bar
+        closes = df["close"].to_numpy()
+        bar_times = [d if isinstance(d, datetime) else d.to_pydatetime() for d in df.index]
+        equity = np.empty(len(df) - warmup, dtype=np.float64)
+        hedge_closes = None
+        if hedge_df is not None:
+            hedge_closes = hedge_df["close"].reindex(df.index).to_numpy()
+            has_hedge_bar = df.index.isin(hedge_df.index)
+
+        # Strategy settings read once, not through attribute chains every bar
+        stop_loss_pct = settings.strategy.stop_loss_pct
+        short_stop_loss_pct = settings.strategy.short_stop_loss_pct
+        short_position_size_pct = settings.strategy.short_position_size_pct
+        inverse_symbol = settings.strategy.inverse_symbol
+
+        # Bars where a signal can fire; the rest skip the signal generator
+        entry_candidates = self.signal_generator.entry_candidates(df)
+        long_exit_candidates = self.signal_generator.exit_candidates(df)
+
         for i in range(warmup, len(df)):
-            current_date = df.index[i]
-            current_data = df.iloc[:i+1]
-            current_bar = df.iloc[i]
+            bar_time = bar_times[i]
+            bar_close = closes[i]
 
-            # Get hedge symbol data if available
-            hedge_bar = None
-            if hedge_df is not None and current_date in hedge_df.index:
-                hedge_bar = hedge_df.loc[current_date]
+            # Get hedge symbol price if available
+            hedge_close = None
+            if hedge_closes is not None and has_hedge_bar[i]:
+                hedge_close = hedge_closes[i]
 
             # Check for signals
             has_position = portfolio.has_position
 
             if has_position and entry_price is not None:
                 # Check for exit based on position type
-                current_hedge_price = hedge_bar["close"] if hedge_bar is not None else None
-                signal = self.signal_generator.generate_signals(
-                    current_data,
-                    has_position=True,
-                    entry_price=entry_price,
-                    stop_loss_pct=settings.strategy.stop_loss_pct,
-                    position_side=position_side,
-                    short_stop_loss_pct=settings.strategy.short_stop_loss_pct,
-                    hedge_entry_price=hedge_entry_price,
-                    current_hedge_price=current_hedge_price,
-                )
+                current_hedge_price = hedge_close
+                if (
+                    position_side == "long"
+                    and not long_exit_candidates[i]
+                    and (bar_close - entry_price) / entry_price > -stop_loss_pct
+                ):
+                    signal = None
+                else:
+                    signal = self.signal_generator.generate_signals(
+                        df,
+                        has_position=True,
+                        entry_price=entry_price,
+                        stop_loss_pct=stop_loss_pct,
+                        position_side=position_side,
+                        short_stop_loss_pct=short_stop_loss_pct,
+                        hedge_entry_price=hedge_entry_price,
+                        current_hedge_price=current_hedge_price,
+                        idx=i,
+                    )
 
                 exit_signal_types = (SignalType.SELL, SignalType.COVER, SignalType.HEDGE_SELL)
                 if signal and signal.signal_type in exit_signal_types:
                     # Determine exit price based on position type
-                    if position_side == "hedge" and hedge_bar is not None:
+                    if position_side == "hedge" and hedge_close is not None:
                         # Exit SQQQ position
-                        exit_price = hedge_bar["close"] * (1 - self.slippage_pct)
-                        position = portfolio.get_position(settings.strategy.inverse_symbol)
-                        trade_symbol = settings.strategy.inverse_symbol
+                        exit_price = hedge_close * (1 - self.slippage_pct)
+                        position = portfolio.get_position(inverse_symbol)
+                        trade_symbol = inverse_symbol
                     elif position_side == "short":
-                        exit_price = current_bar["close"] * (1 + self.slippage_pct)
+                        exit_price = bar_close * (1 + self.slippage_pct)
                         position = portfolio.get_position(symbol)
                         trade_symbol = symbol
                     else:
-                        exit_price = current_bar["close"] * (1 - self.slippage_pct)
+                        exit_price = bar_close * (1 - self.slippage_pct)
                         position = portfolio.get_position(symbol)
                         trade_symbol = symbol
 
@@ -374,7 +415,7 @@ class BacktestEngine:
                         pnl = portfolio.close_position(
                             symbol=trade_symbol,
                             price=exit_price,
-                            timestamp=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                            timestamp=bar_time,
                             commission=self.commission,
                         )
 
@@ -384,7 +425,7 @@ class BacktestEngine:
 
                         # Complete trade record
                         if current_trade:
-                            current_trade.exit_date = current_date if isinstance(current_date, datetime) else current_date.to_pydatetime()
+                            current_trade.exit_date = bar_time
                             current_trade.exit_price = exit_price
                             current_trade.pnl = pnl
                             if position_side == "hedge" and hedge_entry_price:
@@ -403,36 +444,40 @@ class BacktestEngine:
 
             else:
                 # Check for entry (long, short, or hedge)
-                signal = self.signal_generator.generate_signals(
-                    current_data,
-                    has_position=False,
-                )
+                signal = None
+                if entry_candidates[i]:
+                    signal = self.signal_generator.generate_signals(
+                        df,
+                        has_position=False,
+                        idx=i,
+                    )
 
                 if signal and signal.signal_type == SignalType.BUY:
                     # Long entry (TQQQ)
                     pos_size = self.risk_manager.calculate_position_size(
                         account_value=portfolio.equity,
-                        current_price=current_bar["close"],
+                        current_price=bar_close,
                         use_fractional=True,
                     )
 
                     if pos_size.shares > 0:
-                        buy_price = current_bar["close"] * (1 + self.slippage_pct)
+                        buy_price = bar_close * (1 + self.slippage_pct)
 
                         try:
                             portfolio.open_position(
                                 symbol=symbol,
                                 quantity=pos_size.shares,
                                 price=buy_price,
-                                timestamp=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                timestamp=bar_time,
                                 commission=self.commission,
                             )
 
                             entry_price = buy_price
+                            mark_price = buy_price
                             position_side = "long"
 
                             current_trade = BacktestTrade(
-                                entry_date=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                entry_date=bar_time,
                                 entry_price=buy_price,
                                 quantity=pos_size.shares,
                                 side="BUY",
@@ -442,33 +487,34 @@ class BacktestEngine:
                         except ValueError as e:
                             logger.warning(f"Could not open long position: {e}")
 
-                elif signal and signal.signal_type == SignalType.HEDGE_BUY and hedge_bar is not None:
+                elif signal and signal.signal_type == SignalType.HEDGE_BUY and hedge_close is not None:
                     # Hedge entry: Buy SQQQ instead of shorting TQQQ
                     pos_size = self.risk_manager.calculate_position_size(
                         account_value=portfolio.equity,
-                        current_price=hedge_bar["close"],
+                        current_price=hedge_close,
                         use_fractional=True,
-                        position_size_pct=settings.strategy.short_position_size_pct,
+                        position_size_pct=short_position_size_pct,
                     )
 
                     if pos_size.shares > 0:
-                        buy_price = hedge_bar["close"] * (1 + self.slippage_pct)
+                        buy_price = hedge_close * (1 + self.slippage_pct)
 
                         try:
                             portfolio.open_position(
-                                symbol=settings.strategy.inverse_symbol,
+                                symbol=inverse_symbol,
                                 quantity=pos_size.shares,
                                 price=buy_price,
-                                timestamp=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                timestamp=bar_time,
                                 commission=self.commission,
                             )
 
-                            entry_price = current_bar["close"]  # TQQQ price for RSI tracking
+                            entry_price = bar_close  # TQQQ price for RSI tracking
                             hedge_entry_price = buy_price  # SQQQ price for stop loss
+                            mark_price = buy_price
                             position_side = "hedge"
 
                             current_trade = BacktestTrade(
-                                entry_date=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                entry_date=bar_time,
                                 entry_price=buy_price,
                                 quantity=pos_size.shares,
                                 side="HEDGE",
@@ -484,28 +530,29 @@ class BacktestEngine:
                     # Direct short entry (TQQQ)
                     pos_size = self.risk_manager.calculate_position_size(
                         account_value=portfolio.equity,
-                        current_price=current_bar["close"],
+                        current_price=bar_close,
                         use_fractional=True,
-                        position_size_pct=settings.strategy.short_position_size_pct,
+                        position_size_pct=short_position_size_pct,
                     )
 
                     if pos_size.shares > 0:
-                        short_price = current_bar["close"] * (1 - self.slippage_pct)
+                        short_price = bar_close * (1 - self.slippage_pct)
 
                         try:
                             portfolio.open_position(
                                 symbol=symbol,
                                 quantity=pos_size.shares,
                                 price=short_price,
-                                timestamp=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                timestamp=bar_time,
                                 commission=self.commission,
                             )
 
                             entry_price = short_price
+                            mark_price = short_price
                             position_side = "short"
 
                             current_trade = BacktestTrade(
-                                entry_date=current_date if isinstance(current_date, datetime) else current_date.to_pydatetime(),
+                                entry_date=bar_time,
                                 entry_price=short_price,
                                 quantity=pos_size.shares,
                                 side="SHORT",
@@ -515,33 +562,34 @@ class BacktestEngine:
                         except ValueError as e:
                             logger.warning(f"Could not open short position: {e}")
 
-            # Update portfolio prices
-            if portfolio.has_position:
+            # Record equity, marking the single open position (if any) to
+            # market here rather than revaluing the portfolio every bar.
+            # Shorts stay at their entry price, as the portfolio holds them.
+            if current_trade is not None:
                 if position_side == "long":
-                    portfolio.update_prices({symbol: current_bar["close"]})
-                elif position_side == "hedge" and hedge_bar is not None:
-                    portfolio.update_prices({settings.strategy.inverse_symbol: hedge_bar["close"]})
-
-            # Record equity
-            equity_values.append(portfolio.equity)
-            dates.append(current_date)
+                    mark_price = bar_close
+                elif position_side == "hedge" and hedge_close is not None:
+                    mark_price = hedge_close
+                equity[i - warmup] = portfolio.cash + current_trade.quantity * mark_price
+            else:
+                equity[i - warmup] = portfolio.cash
 
         # Close any remaining position at end
         if portfolio.has_position and current_trade:
             if position_side == "hedge" and hedge_df is not None:
                 final_price = hedge_df.iloc[-1]["close"]
-                trade_symbol = settings.strategy.inverse_symbol
+                trade_symbol = inverse_symbol
                 pnl = portfolio.close_position(symbol=trade_symbol, price=final_price)
             elif position_side == "short":
-                final_price = df.iloc[-1]["close"]
+                final_price = closes[-1]
                 trade_symbol = symbol
                 pnl = (entry_price - final_price) * current_trade.quantity - self.commission
             else:
-                final_price = df.iloc[-1]["close"]
+                final_price = closes[-1]
                 trade_symbol = symbol
                 pnl = portfolio.close_position(symbol=trade_symbol, price=final_price)
 
-            current_trade.exit_date = df.index[-1] if isinstance(df.index[-1], datetime) else df.index[-1].to_pydatetime()
+            current_trade.exit_date = bar_times[-1]
             current_trade.exit_price = final_price
             current_trade.pnl = pnl
             if position_side == "hedge" and hedge_entry_price:
@@ -552,7 +600,7 @@ class BacktestEngine:
             current_trade.exit_reason = "End of backtest period"
             trades.append(current_trade)
 
-        equity_curve = pd.Series(equity_values, index=dates)
+        equity_curve = pd.Series(equity, index=df.index[warmup:])
         return equity_curve, trades
 
     def _get_parameters(self) -> dict:
@@ -183,8 +183,7 @@ class MetricsCalculator:
 
     def _calculate_drawdown(self, equity_curve: pd.Series) -> dict:
         """Calculate drawdown metrics."""
-        rolling_max = equity_curve.expanding().max()
-        drawdowns = (equity_curve - rolling_max) / rolling_max * 100
+        drawdowns = self.get_drawdown_series(equity_curve)
 
         max_dd = drawdowns.min()
 
@@ -253,6 +252,8 @@ class MetricsCalculator:
             metrics.avg_trade_duration_days = np.mean(holding_days)
 
     def get_drawdown_series(self, equity_curve: pd.Series) -> pd.Series:
-        """Get drawdown series for plotting."""
-        rolling_max = equity_curve.expanding().max()
-        return (equity_curve - rolling_max) / rolling_max * 100
+        """Get drawdown series (percent below running peak) for plotting."""
+        equity = equity_curve.to_numpy(dtype=np.float64)
+        # Running peak in one pass; fmax skips NaN like expanding().max()
+        peak = np.fmax.accumulate(equity)
+        return pd.Series((equity - peak) / peak * 100, index=equity_curve.index, name=equity_curve.name)
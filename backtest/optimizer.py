@@ -2,18 +2,61 @@
 Parameter optimization for strategy.
 """
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from itertools import product
 from typing import Optional
 
 import pandas as pd
 
 from backtest.engine import BacktestEngine, BacktestResult
-from config.settings import get_settings
+from config.settings import StrategyConfig, get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _init_worker(strategy: StrategyConfig) -> None:
+    """Give a sweep worker process the parent's strategy settings."""
+    get_settings().strategy = strategy
+
+
+def _run_backtest(
+    params: dict,
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+) -> tuple[Optional[BacktestResult], Optional[str]]:
+    """
+    Run one backtest with strategy parameters applied to this process's settings.
+
+    Args:
+        params: Strategy settings to override
+        start_date: Backtest start date
+        end_date: Backtest end date
+        initial_capital: Starting capital
+
+    Returns:
+        (result, None) on success, (None, error message) on failure
+    """
+    strategy = get_settings().strategy
+    saved = {key: getattr(strategy, key) for key in params}
+    for key, value in params.items():
+        setattr(strategy, key, value)
+
+    try:
+        engine = BacktestEngine(initial_capital=initial_capital)
+        return engine.run(start_date=start_date, end_date=end_date), None
+    except Exception as e:
+        return None, str(e)
+    finally:
+        # Leave the caller's settings as they were, in or out of a worker
+        for key, value in saved.items():
+            setattr(strategy, key, value)
+
+
 @dataclass
 class OptimizationResult:
     """Result of parameter optimization."""
@@ -76,6 +119,7 @@ class StrategyOptimizer:
         rsi_overbought_levels: list[float] = [60, 70, 80],
         stop_loss_pcts: list[float] = [0.03, 0.05, 0.07],
         optimize_for: str = "sharpe",
+        max_workers: Optional[int] = 1,
     ) -> OptimizationResult:
         """
         Run grid search optimization.
@@ -86,11 +130,12 @@ class StrategyOptimizer:
             rsi_overbought_levels: Overbought thresholds to test
             stop_loss_pcts: Stop loss percentages to test
             optimize_for: Metric to optimize (sharpe, return, calmar)
+            max_workers: Backtest processes to run in parallel (CPU count if
+                None; the default 1 runs them in this process)
 
         Returns:
             OptimizationResult with best parameters
         """
-        settings = get_settings()
         all_results = []
         best_result = None
         best_score = float("-inf")
@@ -105,65 +150,55 @@ class StrategyOptimizer:
 
         logger.info(f"Starting grid search with {len(combinations)} combinations")
 
-        for i, (rsi_period, rsi_oversold, rsi_overbought, stop_loss) in enumerate(combinations):
-            # Skip invalid combinations
-            if rsi_oversold >= rsi_overbought:
+        # Skip invalid combinations
+        param_grid = [
+            {
+                "rsi_period": rsi_period,
+                "rsi_oversold": rsi_oversold,
+                "rsi_overbought": rsi_overbought,
+                "stop_loss_pct": stop_loss,
+            }
+            for rsi_period, rsi_oversold, rsi_overbought, stop_loss in combinations
+            if rsi_oversold < rsi_overbought
+        ]
+
+        for i, (params, (result, error)) in enumerate(
+            zip(param_grid, self._run_grid(param_grid, max_workers))
+        ):
+            if result is None:
+                logger.warning(f"Backtest failed for params: {error}")
                 continue
 
-            # Update settings
-            settings.strategy.rsi_period = rsi_period
-            settings.strategy.rsi_oversold = rsi_oversold
-            settings.strategy.rsi_overbought = rsi_overbought
-            settings.strategy.stop_loss_pct = stop_loss
-
-            # Run backtest
-            try:
-                engine = BacktestEngine(initial_capital=self.initial_capital)
-                result = engine.run(
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                )
-
-                # Get optimization score
-                if optimize_for == "sharpe":
-                    score = result.metrics.sharpe_ratio
-                elif optimize_for == "return":
-                    score = result.metrics.total_return_pct
-                elif optimize_for == "calmar":
-                    score = result.metrics.calmar_ratio
-                else:
-                    score = result.metrics.sharpe_ratio
-
-                params = {
-                    "rsi_period": rsi_period,
-                    "rsi_oversold": rsi_oversold,
-                    "rsi_overbought": rsi_overbought,
-                    "stop_loss_pct": stop_loss,
-                }
-
-                all_results.append({
-                    **params,
-                    "sharpe": result.metrics.sharpe_ratio,
-                    "return_pct": result.metrics.total_return_pct,
-                    "max_dd": result.metrics.max_drawdown,
-                    "win_rate": result.metrics.win_rate,
-                    "trades": result.metrics.total_trades,
-                    "profit_factor": result.metrics.profit_factor,
-                })
-
-                if score > best_score:
-                    best_score = score
-                    best_result = result
-                    best_params = params
-
-                logger.debug(
-                    f"[{i+1}/{len(combinations)}] "
-                    f"RSI({rsi_period}, {rsi_oversold}/{rsi_overbought}), "
-                    f"SL={stop_loss*100}% -> Sharpe: {result.metrics.sharpe_ratio:.3f}"
-                )
-
-            except Exception as e:
-                logger.warning(f"Backtest failed for params: {e}")
+            # Get optimization score
+            if optimize_for == "sharpe":
+                score = result.metrics.sharpe_ratio
+            elif optimize_for == "return":
+                score = result.metrics.total_return_pct
+            elif optimize_for == "calmar":
+                score = result.metrics.calmar_ratio
+            else:
+                score = result.metrics.sharpe_ratio
+
+            all_results.append({
+                **params,
+                "sharpe": result.metrics.sharpe_ratio,
+                "return_pct": result.metrics.total_return_pct,
+                "max_dd": result.metrics.max_drawdown,
+                "win_rate": result.metrics.win_rate,
+                "trades": result.metrics.total_trades,
+                "profit_factor": result.metrics.profit_factor,
+            })
+
+            if score > best_score:
+                best_score = score
+                best_result = result
+                best_params = params
+
+            logger.debug(
+                f"[{i+1}/{len(param_grid)}] "
+                f"RSI({params['rsi_period']}, {params['rsi_oversold']}/{params['rsi_overbought']}), "
+                f"SL={params['stop_loss_pct']*100}% -> Sharpe: {result.metrics.sharpe_ratio:.3f}"
+            )
 
         if best_result is None:
             raise ValueError("No valid backtest results")
@@ -177,6 +212,55 @@ class StrategyOptimizer:
             all_results=all_results,
         )
 
+    def _run_grid(
+        self,
+        param_grid: list[dict],
+        max_workers: Optional[int],
+    ) -> list[tuple[Optional[BacktestResult], Optional[str]]]:
+        """
+        Run a backtest per parameter set, in parameter order.
+
+        Args:
+            param_grid: Strategy settings to override, one dict per backtest
+            max_workers: Process count (CPU count if None; 1 runs in this process)
+
+        Returns:
+            (result, error) per parameter set
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        run = partial(
+            _run_backtest,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            initial_capital=self.initial_capital,
+        )
+
+        if max_workers == 1 or len(param_grid) <= 1:
+            return [run(params) for params in param_grid]
+
+        settings = get_settings()
+        # Fetch (and cache) bars once up front so workers don't race to
+        # download and write the same cache files
+        symbols = [settings.strategy.symbol]
+        if settings.strategy.short_enabled and settings.strategy.use_inverse_etf:
+            symbols.append(settings.strategy.inverse_symbol)
+        try:
+            engine = BacktestEngine(initial_capital=self.initial_capital)
+            for symbol in symbols:
+                engine.get_data(symbol, self.start_date, self.end_date)
+        except Exception as e:
+            logger.warning(f"Could not prefetch backtest data: {e}")
+
+        # Spawned workers start from a clean import; the initializer hands
+        # them the strategy settings this process is running with
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(param_grid)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(settings.strategy,),
+        ) as pool:
+            return list(pool.map(run, param_grid, chunksize=4))
+
     def walk_forward(
         self,
         train_months: int = 6,
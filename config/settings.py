@@ -147,6 +147,11 @@ class DiscordConfig:
     weekly_webhook_url: str = field(
         default_factory=lambda: os.getenv("DISCORD_WEEKLY_WEBHOOK_URL", "")
     )
+    # Skip the weekly post when there were no trades and the bot never ran
+    skip_empty_weekly: bool = field(
+        default_factory=lambda: os.getenv("DISCORD_SKIP_EMPTY_WEEKLY", "").lower()
+        in ("true", "1", "yes")
+    )
     enabled: bool = field(
         default_factory=lambda: bool(os.getenv("DISCORD_WEBHOOK_URL", ""))
     )
@@ -171,7 +176,7 @@ settings = Settings()
 
 
 def get_settings() -> Settings:
-    """Get global settings instance."""
+    """Get global settings instance (built once at import, so no caching needed)."""
     return settings
 
 
@@ -0,0 +1,303 @@
+"""
+Shared access to the trade log file (logs/trades.json).
+
+Reports and analytics only ever need a date slice of the trade history, so
+trades are streamed one record at a time instead of materializing the whole
+file. Two on-disk formats are understood:
+
+- newline-delimited JSON (one trade per line), which can be read backwards
+  from the end of the file so "today" never touches older history
+- the legacy single JSON array, streamed with ijson when installed and
+  falling back to a full parse (memory-mapped when orjson is available)
+
+Writers only produce NDJSON, so logging a trade is a single appended line.
+"""
+import json
+import mmap
+import os
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Block size for reading NDJSON logs backwards from EOF
+_REVERSE_CHUNK = 64 * 1024
+
+_TIMESTAMP_KEY = b'"timestamp_utc"'
+
+
+def _is_json_array(f: BinaryIO) -> bool:
+    """Check whether an open log holds a legacy JSON array, then rewind."""
+    try:
+        for chunk in iter(lambda: f.read(256), b""):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped.startswith(b"[")
+        return False
+    finally:
+        f.seek(0)
+
+
+def _load_array(f: BinaryIO) -> list[dict]:
+    """
+    Parse a whole legacy JSON array log.
+
+    With orjson the file is memory-mapped and parsed in place, skipping the
+    copy of the full contents f.read() would make.
+    """
+    if not ORJSON_AVAILABLE:
+        return json.load(f)
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _iter_array(f: BinaryIO) -> Iterator[dict]:
+    """Iterate over trades in a legacy JSON array log."""
+    if not IJSON_AVAILABLE:
+        yield from _load_array(f)
+        return
+
+    try:
+        # Binary file handle lets ijson pick its C (yajl2_c) backend
+        yield from ijson.items(f, "item", use_float=True)
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
+def is_json_array_log(trades_file: str) -> bool:
+    """
+    Check whether a trade log is in the legacy JSON array format.
+
+    Args:
+        trades_file: Path to trades log
+
+    Returns:
+        True for a JSON array log, False for NDJSON (or an empty file)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(trades_file, "rb") as f:
+        return _is_json_array(f)
+
+
+def _dumps_line(trade: dict) -> str:
+    """Serialize one trade as an NDJSON line."""
+    return json.dumps(trade, default=str) + "\n"
+
+
+def append_trade(trades_file: str, trade: dict) -> None:
+    """
+    Append a trade to an NDJSON log, creating the file if needed.
+
+    Args:
+        trades_file: Path to trades log (must not be a legacy JSON array)
+        trade: Trade dictionary
+    """
+    with open(trades_file, "a") as f:
+        f.write(_dumps_line(trade))
+
+
+def write_trades(trades_file: str, trades: Iterable[dict]) -> int:
+    """
+    Replace a trade log with the given trades as NDJSON.
+
+    The file is written next to the target and moved into place, so readers
+    never see a partial log.
+
+    Args:
+        trades_file: Path to trades log
+        trades: Trade dictionaries, oldest first
+
+    Returns:
+        Number of trades written
+    """
+    tmp_file = f"{trades_file}.tmp"
+    count = 0
+    with open(tmp_file, "w") as f:
+        for trade in trades:
+            f.write(_dumps_line(trade))
+            count += 1
+    os.replace(tmp_file, trades_file)
+    return count
+
+
+def iter_trades(trades_file: str) -> Iterator[dict]:
+    """
+    Iterate over trades in the log file, oldest first.
+
+    Args:
+        trades_file: Path to trades log (NDJSON or JSON array)
+
+    Yields:
+        Trade dictionaries
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If a record isn't valid JSON
+    """
+    with open(trades_file, "rb") as f:
+        if _is_json_array(f):
+            yield from _iter_array(f)
+            return
+
+        for line in f:
+            line = line.strip()
+            if line:
+                yield _json_loads(line)
+
+
+def _iter_lines_reverse(f: BinaryIO) -> Iterator[bytes]:
+    """Iterate over non-blank lines of an NDJSON log from the end of the file."""
+    pos = f.seek(0, os.SEEK_END)
+    # Start of the earliest line read so far; may be incomplete
+    head = b""
+    while pos > 0:
+        size = min(_REVERSE_CHUNK, pos)
+        pos -= size
+        f.seek(pos)
+        lines = (f.read(size) + head).split(b"\n")
+        head = lines[0]
+        for line in reversed(lines[1:]):
+            line = line.strip()
+            if line:
+                yield line
+
+    head = head.strip()
+    if head:
+        yield head
+
+
+def _iter_ndjson_reverse(f: BinaryIO) -> Iterator[dict]:
+    """Iterate over trades in an NDJSON log from the end of the file."""
+    for line in _iter_lines_reverse(f):
+        yield _json_loads(line)
+
+
+def _line_date(line: bytes) -> Optional[bytes]:
+    """
+    Peek at a raw NDJSON record's timestamp_utc date without decoding it.
+
+    Returns None when the key isn't followed by a string value at least a
+    date long, so the caller can fall back to a full decode.
+    """
+    key = line.find(_TIMESTAMP_KEY)
+    if key < 0:
+        return None
+    value = line.find(b'"', key + len(_TIMESTAMP_KEY))
+    if value < 0 or line[key + len(_TIMESTAMP_KEY):value].strip() != b":":
+        return None
+    date = line[value + 1:value + 11]
+    # A shorter string would leave its closing quote in the slice
+    if len(date) < 10 or b'"' in date:
+        return None
+    return date
+
+
+def iter_trades_reverse(trades_file: str) -> Iterator[dict]:
+    """
+    Iterate over trades in the log file, newest first.
+
+    NDJSON logs are read in blocks from the end of the file, so stopping
+    early only costs the records actually visited. Legacy JSON array logs
+    have no record boundaries to seek by and are read in full.
+
+    Args:
+        trades_file: Path to trades log (NDJSON or JSON array)
+
+    Yields:
+        Trade dictionaries
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If a record isn't valid JSON
+    """
+    with open(trades_file, "rb") as f:
+        if _is_json_array(f):
+            yield from reversed(list(_iter_array(f)))
+        else:
+            yield from _iter_ndjson_reverse(f)
+
+
+def trades_between(
+    trades_file: str, start_date: str, end_date: Optional[str] = None
+) -> list[dict]:
+    """
+    Get trades whose timestamp_utc date falls in a range, oldest first.
+
+    NDJSON logs are appended in time order, so they are scanned from the end
+    and the scan stops at the first trade before start_date. Dates are read
+    off the raw line, so only matching records are decoded. Legacy JSON
+    array logs make no ordering promise and are filtered in full.
+
+    Args:
+        trades_file: Path to trades log (NDJSON or JSON array)
+        start_date: First date to include (YYYY-MM-DD)
+        end_date: Last date to include (YYYY-MM-DD); open-ended if None
+
+    Returns:
+        Matching trade dictionaries
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If a record isn't valid JSON
+    """
+    if end_date is None:
+        # Sorts after any real date
+        end_date = "9999-12-31"
+
+    with open(trades_file, "rb") as f:
+        if _is_json_array(f):
+            return [
+                trade for trade in _iter_array(f)
+                if start_date <= (trade.get("timestamp_utc") or "")[:10] <= end_date
+            ]
+
+        start_key = start_date.encode()
+        end_key = end_date.encode()
+        trades = []
+        for line in _iter_lines_reverse(f):
+            trade = None
+            trade_date = _line_date(line)
+            if trade_date is None:
+                trade = _json_loads(line)
+                trade_date = (trade.get("timestamp_utc") or "")[:10].encode()
+
+            if start_key <= trade_date <= end_key:
+                trades.append(trade if trade is not None else _json_loads(line))
+            elif trade_date and trade_date < start_key:
+                break
+        trades.reverse()
+        return trades
+
+
+def trades_on_date(trades_file: str, date: str) -> list[dict]:
+    """
+    Get trades whose timestamp_utc falls on a date, oldest first.
+
+    Args:
+        trades_file: Path to trades log (NDJSON or JSON array)
+        date: Date to match (YYYY-MM-DD)
+
+    Returns:
+        Matching trade dictionaries
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If a record isn't valid JSON
+    """
+    return trades_between(trades_file, date, date)
@@ -9,6 +9,12 @@ from typing import Optional
 
 import pandas as pd
 
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from config.settings import DATA_DIR
 
 logger = logging.getLogger(__name__)
@@ -80,7 +86,12 @@ class DataStorage:
         path = self._get_cache_path(symbol, timeframe, start_date, end_date)
 
         if path.exists():
-            df = pd.read_parquet(path)
+            if PYARROW_AVAILABLE:
+                # Map the file instead of reading it into a buffer, so repeated
+                # backtests over the same bars reuse the OS page cache
+                df = pq.read_table(path, memory_map=True).to_pandas()
+            else:
+                df = pd.read_parquet(path)
             logger.info(f"Loaded {len(df)} bars from cache: {path}")
             return df
 
@@ -10,6 +10,7 @@ For new code, consider using the services directly:
 - execution.services.retry.RetryService
 """
 import logging
+import threading
 from typing import Optional
 
 try:
@@ -62,6 +63,8 @@ class AlpacaBroker:
         self.paper = paper
         self.retry_config = retry_config or RetryConfig()
         self._client: Optional[TradingClient] = None
+        # Guards lazy client creation when account/position calls run in parallel
+        self._client_lock = threading.Lock()
 
         # Initialize services (will set client lazily)
         self._account_service = AccountService(
@@ -77,14 +80,17 @@ class AlpacaBroker:
         if not ALPACA_AVAILABLE:
             raise ImportError("alpaca-py not installed")
         if self._client is None:
-            self._client = TradingClient(
-                api_key=self.api_key,
-                secret_key=self.secret_key,
-                paper=self.paper,
-            )
-            # Share client with services
-            self._account_service.set_client(self._client)
-            self._order_service.client = self._client
+            with self._client_lock:
+                if self._client is None:
+                    client = TradingClient(
+                        api_key=self.api_key,
+                        secret_key=self.secret_key,
+                        paper=self.paper,
+                    )
+                    # Share one client (and its HTTP session) with services
+                    self._account_service.set_client(client)
+                    self._order_service.client = client
+                    self._client = client
         return self._client
 
     @property
@@ -1,7 +1,6 @@
 """
 Trade logging system for ATO tax compliance.
 """
-import json
 import logging
 import uuid
 from datetime import datetime
@@ -13,6 +12,7 @@ import requests
 
 from config.constants import AEST_TIMEZONE, EXCHANGE_RATE_API_URL, STRATEGY_NAME
 from config.settings import LOGS_DIR
+from core.trade_log import append_trade, is_json_array_log, iter_trades, write_trades
 
 logger = logging.getLogger(__name__)
 
@@ -169,7 +169,7 @@ class TradeLog:
 
 
 class TradeLogger:
-    """Logger for all trades with JSON persistence."""
+    """Logger for all trades with append-only NDJSON persistence."""
 
     def __init__(self, log_dir: Optional[Path] = None):
         """
@@ -186,24 +186,20 @@ class TradeLogger:
         self._load_existing()
 
     def _load_existing(self) -> None:
-        """Load existing trades from file."""
+        """Load existing trades from file, migrating a legacy JSON array log."""
         if self.log_file.exists():
             try:
-                with open(self.log_file, "r") as f:
-                    self._trades = json.load(f)
+                self._trades = list(iter_trades(str(self.log_file)))
                 logger.info(f"Loaded {len(self._trades)} existing trades")
+
+                # New trades are appended as lines, which an array can't take
+                if is_json_array_log(str(self.log_file)):
+                    write_trades(str(self.log_file), self._trades)
+                    logger.info("Converted trade log to NDJSON")
             except Exception as e:
                 logger.warning(f"Failed to load existing trades: {e}")
                 self._trades = []
 
-    def _save(self) -> None:
-        """Save trades to file."""
-        try:
-            with open(self.log_file, "w") as f:
-                json.dump(self._trades, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Failed to save trades: {e}")
-
     def log_trade(
         self,
         symbol: str,
@@ -257,8 +253,12 @@ class TradeLogger:
             entry_time=entry_time,
         )
 
-        self._trades.append(trade.to_dict())
-        self._save()
+        trade_dict = trade.to_dict()
+        self._trades.append(trade_dict)
+        try:
+            append_trade(str(self.log_file), trade_dict)
+        except Exception as e:
+            logger.error(f"Failed to save trade: {e}")
 
         logger.info(
             f"Logged trade: {side} {quantity:.4f} {symbol} @ ${fill_price:.2f} "
@@ -306,5 +306,8 @@ class TradeLogger:
     def clear(self) -> None:
         """Clear all trades (use with caution)."""
         self._trades = []
-        self._save()
+        try:
+            write_trades(str(self.log_file), [])
+        except Exception as e:
+            logger.error(f"Failed to clear trades: {e}")
         logger.warning("All trades cleared")
@@ -3,6 +3,8 @@ Discord webhook notifications.
 """
 import json
 import logging
+import queue
+import threading
 from typing import Optional
 
 import requests
@@ -10,6 +12,7 @@ import requests
 from config.constants import DISCORD_MAX_MESSAGE_LENGTH
 from config.settings import get_settings
 from notifications.templates import MessageTemplates
+from notifications.webhook import get_webhook_session
 from backtest.engine import BacktestResult
 
 logger = logging.getLogger(__name__)
@@ -18,21 +21,31 @@ logger = logging.getLogger(__name__)
 class DiscordNotifier:
     """Send notifications via Discord webhook."""
 
-    def __init__(self, webhook_url: Optional[str] = None):
+    def __init__(self, webhook_url: Optional[str] = None, background: bool = False):
         """
         Initialize Discord notifier.
 
         Args:
             webhook_url: Discord webhook URL
+            background: Post from a worker thread so callers never block on
+                Discord (sends then report True once queued)
         """
         settings = get_settings()
         self.webhook_url = webhook_url or settings.discord.webhook_url
         self.enabled = bool(self.webhook_url)
         self.templates = MessageTemplates()
 
-    def _send(self, payload: dict) -> bool:
+        # Single worker keeps messages in the order they were sent
+        self._queue: Optional[queue.Queue] = None
+        if background and self.enabled:
+            self._queue = queue.Queue()
+            threading.Thread(
+                target=self._drain_queue, name="discord-sender", daemon=True
+            ).start()
+
+    def _post(self, payload: dict) -> bool:
         """
-        Send payload to Discord webhook.
+        Post payload to the Discord webhook.
 
         Args:
             payload: Discord message payload
@@ -40,12 +53,8 @@ class DiscordNotifier:
         Returns:
             True if successful
         """
-        if not self.enabled:
-            logger.debug("Discord notifications disabled")
-            return False
-
         try:
-            response = requests.post(
+            response = get_webhook_session().post(
                 self.webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -59,6 +68,40 @@ class DiscordNotifier:
             logger.error(f"Failed to send Discord notification: {e}")
             return False
 
+    def _drain_queue(self):
+        """Post queued payloads until the process exits."""
+        while True:
+            payload = self._queue.get()
+            try:
+                self._post(payload)
+            finally:
+                self._queue.task_done()
+
+    def _send(self, payload: dict) -> bool:
+        """
+        Send payload to Discord webhook.
+
+        Args:
+            payload: Discord message payload
+
+        Returns:
+            True if successful (or queued, in background mode)
+        """
+        if not self.enabled:
+            logger.debug("Discord notifications disabled")
+            return False
+
+        if self._queue is not None:
+            self._queue.put(payload)
+            return True
+
+        return self._post(payload)
+
+    def flush(self):
+        """Block until every queued message has been posted."""
+        if self._queue is not None:
+            self._queue.join()
+
     def send_message(self, content: str) -> bool:
         """
         Send simple text message.
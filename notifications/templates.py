@@ -1,10 +1,10 @@
 """
 Message templates for Discord notifications.
 """
-from datetime import datetime
 from typing import Optional
 
 from backtest.engine import BacktestResult
+from notifications.webhook import embed_timestamp
 
 
 class MessageTemplates:
@@ -35,7 +35,7 @@ class MessageTemplates:
         embed = {
             "title": "📊 Backtest Report - RSI(2) TQQQ",
             "color": color,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": embed_timestamp(),
             "fields": [
                 {
                     "name": "📅 Period",
@@ -158,7 +158,7 @@ class MessageTemplates:
         embed = {
             "title": f"📈 Trade Executed - {side} {symbol}",
             "color": color,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": embed_timestamp(),
             "fields": fields,
         }
 
@@ -184,7 +184,7 @@ class MessageTemplates:
         embed = {
             "title": "🚨 Error Alert",
             "color": 0xFF0000,  # Red
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": embed_timestamp(),
             "fields": [
                 {
                     "name": "Error Type",
@@ -239,7 +239,7 @@ class MessageTemplates:
         embed = {
             "title": f"📊 Daily Summary - {date}",
             "color": color,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": embed_timestamp(),
             "fields": [
                 {
                     "name": "Portfolio Value",
@@ -291,7 +291,7 @@ class MessageTemplates:
         embed = {
             "title": f"🎯 Signal: {signal_type} {symbol}",
             "color": colors.get(signal_type, 0x808080),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": embed_timestamp(),
             "fields": [
                 {
                     "name": "Price",
@@ -0,0 +1,82 @@
+"""
+Shared HTTP session and payload encoding for Discord webhook posts.
+"""
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_webhook_session() -> requests.Session:
+    """
+    Get the shared webhook session, creating it on first use.
+
+    Reports and notifiers all post to discord.com, so one pooled session
+    keeps the TLS connection alive between sends.
+
+    Returns:
+        Session with retrying HTTPS adapter mounted
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                # Discord rate-limits webhooks; back off on 429 and transient
+                # 5xx instead of dropping the message. A read timeout may mean
+                # the post landed, so it is never resent (read=0), and
+                # Retry-After is ignored so the total wait stays at 0+1+2s.
+                retry = Retry(
+                    total=3,
+                    read=0,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"POST"}),
+                    respect_retry_after_header=False,
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry),
+                )
+                _SESSION = session
+    return _SESSION
+
+
+def embed_timestamp() -> str:
+    """
+    Get the current UTC time formatted for an embed's timestamp field.
+
+    Returns:
+        ISO 8601 timestamp with second precision and a Z suffix
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def embed_body(embed: dict) -> bytes:
+    """
+    Serialize a webhook payload carrying a single embed.
+
+    Args:
+        embed: Discord embed
+
+    Returns:
+        JSON request body (post with Content-Type: application/json)
+    """
+    payload = {"embeds": [embed]}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
@@ -12,6 +12,7 @@ from typing import Optional
 import pandas as pd
 
 from config.settings import StrategyConfig, get_settings
+from core.trade_log import trades_between
 from data.fetcher import DataFetcher
 from strategy.indicators import add_all_indicators
 
@@ -220,35 +221,31 @@ class ReportGenerator:
         """
         trades = []
         try:
-            with open(trades_file, "r") as f:
-                all_trades = json.load(f)
-
             # 10일 전 날짜 (백테스트 워밍업 고려)
             cutoff = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
 
-            for trade in all_trades:
-                trade_date = trade.get("timestamp_utc", "")[:10]
-                if trade_date >= cutoff:  # 최근 7일 트레이드 모두 포함
-                    # Calculate holding hours if exit exists
-                    holding_hours = None
-                    if trade.get("exit_time"):
-                        entry = datetime.fromisoformat(trade["timestamp_utc"])
-                        exit_time = datetime.fromisoformat(trade["exit_time"])
-                        holding_hours = (exit_time - entry).total_seconds() / 3600
-
-                    trades.append(
-                        TradeSummary(
-                            trade_id=trade.get("trade_id", "unknown"),
-                            side=trade.get("side", "UNKNOWN"),
-                            entry_time=trade.get("timestamp_utc", ""),
-                            entry_price=trade.get("fill_price", 0.0),
-                            exit_time=trade.get("exit_time"),
-                            exit_price=trade.get("exit_price"),
-                            pnl=trade.get("realized_pnl_usd"),
-                            pnl_percent=trade.get("realized_pnl_percent"),
-                            holding_hours=holding_hours,
-                        )
+            # 최근 7일 트레이드 모두 포함
+            for trade in trades_between(trades_file, cutoff):
+                # Calculate holding hours if exit exists
+                holding_hours = None
+                if trade.get("exit_time"):
+                    entry = datetime.fromisoformat(trade["timestamp_utc"])
+                    exit_time = datetime.fromisoformat(trade["exit_time"])
+                    holding_hours = (exit_time - entry).total_seconds() / 3600
+
+                trades.append(
+                    TradeSummary(
+                        trade_id=trade.get("trade_id", "unknown"),
+                        side=trade.get("side", "UNKNOWN"),
+                        entry_time=trade.get("timestamp_utc", ""),
+                        entry_price=trade.get("fill_price", 0.0),
+                        exit_time=trade.get("exit_time"),
+                        exit_price=trade.get("exit_price"),
+                        pnl=trade.get("realized_pnl_usd"),
+                        pnl_percent=trade.get("realized_pnl_percent"),
+                        holding_hours=holding_hours,
                     )
+                )
 
         except FileNotFoundError:
             logger.warning(f"Trades file not found: {trades_file}")
@@ -271,12 +268,10 @@ class ReportGenerator:
             Performance summary
         """
         try:
-            with open(trades_file, "r") as f:
-                all_trades = json.load(f)
-
             cutoff = (datetime.now() - timedelta(days=days)).isoformat()
             recent = [
-                t for t in all_trades if t.get("timestamp_utc", "") >= cutoff
+                t for t in trades_between(trades_file, cutoff[:10])
+                if (t.get("timestamp_utc") or "") >= cutoff
             ]
 
             if not recent:
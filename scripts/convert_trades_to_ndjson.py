@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Convert a JSON-array trade log to newline-delimited JSON (one trade per line).
+
+NDJSON logs can be read backwards from the end, so daily reports only touch
+today's trades. The original file is kept next to the output as <name>.bak.
+
+TradeLogger converts a legacy log itself the first time it loads one; this
+script is for converting a log offline or keeping a backup.
+
+Usage:
+    python scripts/convert_trades_to_ndjson.py [logs/trades.json]
+"""
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.trade_log import is_json_array_log, iter_trades, write_trades
+
+
+def convert(trades_file: Path) -> int:
+    """
+    Rewrite a trade log as NDJSON in place.
+
+    Args:
+        trades_file: Path to the JSON-array trade log
+
+    Returns:
+        Number of trades written
+    """
+    if not is_json_array_log(str(trades_file)):
+        print(f"{trades_file} is already NDJSON, nothing to do")
+        return 0
+
+    shutil.copy2(trades_file, trades_file.with_suffix(trades_file.suffix + ".bak"))
+    # write_trades only replaces the log once every record has been read
+    return write_trades(str(trades_file), iter_trades(str(trades_file)))
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "logs/trades.json")
+    written = convert(path)
+    print(f"Converted {written} trades in {path}")
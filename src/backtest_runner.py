@@ -26,6 +26,7 @@ load_dotenv()
 from config.settings import get_settings, REPORTS_DIR
 from backtest.engine import BacktestEngine
 from backtest.optimizer import StrategyOptimizer
+from core.trade_log import write_trades
 from notifications.discord import DiscordNotifier
 
 # Optional imports
@@ -143,8 +144,7 @@ def run_backtest(
             "realized_pnl_usd": trade.pnl,
             "realized_pnl_percent": trade.pnl_pct,
         })
-    with open(trades_file, "w") as f:
-        json.dump(trades_for_claude, f, indent=2, default=str)
+    write_trades(str(trades_file), trades_for_claude)
     logger.info(f"Trades saved for Claude: {trades_file} ({len(trades_for_claude)} trades)")
 
     # Generate PDF report
@@ -260,6 +260,7 @@ def run_optimization() -> dict:
         rsi_oversold_levels=[5, 10, 15, 20],
         rsi_overbought_levels=[65, 70, 75, 80],
         stop_loss_pcts=[0.03, 0.05, 0.07],
+        max_workers=None,  # One backtest process per CPU
     )
 
     print("\n" + result.format_summary())
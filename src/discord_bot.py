@@ -6,7 +6,7 @@ import asyncio
 import logging
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import discord
@@ -110,7 +110,7 @@ async def status(interaction: discord.Interaction):
         embed = discord.Embed(
             title="📊 TQQQ Trading Bot Status",
             color=discord.Color.green() if daily_pnl >= 0 else discord.Color.red(),
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
         embed.add_field(
             name="💰 계좌",
@@ -163,7 +163,7 @@ async def positions(interaction: discord.Interaction):
         embed = discord.Embed(
             title="📦 현재 포지션",
             color=discord.Color.blue(),
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
         total_value = 0
@@ -222,7 +222,7 @@ async def strategy(interaction: discord.Interaction):
         embed = discord.Embed(
             title="⚙️ 현재 전략",
             color=discord.Color.purple(),
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
         embed.add_field(
             name="📊 RSI 설정",
@@ -73,7 +73,8 @@ class TradingBot:
         self.broker = AlpacaBroker(paper=(self.mode != TradingMode.LIVE))
         self.trade_logger = TradeLogger()
         self.audit_trail = AuditTrail()
-        self.discord = DiscordNotifier()
+        # Post from a worker so a slow webhook never delays order submission
+        self.discord = DiscordNotifier(background=True)
 
         # Initialize Firestore for dynamic strategy loading
         self.firestore: Optional[FirestoreClient] = None
@@ -688,6 +689,7 @@ class TradingBot:
 
         if self.discord.enabled:
             self.discord.send_message("🛑 **TQQQ Trading Bot Stopped**")
+            self.discord.flush()
 
         logger.info("Shutdown complete")
 
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from config.constants import SignalType
@@ -15,6 +16,11 @@ from strategy.indicators import add_all_indicators
 logger = logging.getLogger(__name__)
 
 
+def _bars_through(df: pd.DataFrame, idx: int) -> int:
+    """Number of bars up to and including position idx (negative counts from the end)."""
+    return idx + 1 if idx >= 0 else len(df) + idx + 1
+
+
 @dataclass
 class Signal:
     """Trading signal with metadata."""
@@ -141,6 +147,7 @@ class SignalGenerator:
         self,
         df: pd.DataFrame,
         has_position: bool = False,
+        idx: int = -1,
     ) -> Optional[Signal]:
         """
         Check for entry (buy) signal with multi-indicator filtering.
@@ -154,6 +161,7 @@ class SignalGenerator:
         Args:
             df: DataFrame with indicators (must call prepare_data first)
             has_position: Whether currently holding position
+            idx: Position of the bar to evaluate (default: last bar)
 
         Returns:
             Signal if entry conditions met, None otherwise
@@ -162,11 +170,11 @@ class SignalGenerator:
             return None
 
         min_period = max(self.sma_period, self.bb_period, self.volume_avg_period)
-        if len(df) < min_period:
+        if _bars_through(df, idx) < min_period:
             return None
 
-        latest = df.iloc[-1]
-        timestamp = df.index[-1]
+        latest = df.iloc[idx]
+        timestamp = df.index[idx]
 
         # Dynamic SMA column name
         sma_col = f"sma_{self.sma_period}"
@@ -238,6 +246,7 @@ class SignalGenerator:
         df: pd.DataFrame,
         entry_price: float,
         stop_loss_pct: float = 0.05,
+        idx: int = -1,
     ) -> Optional[Signal]:
         """
         Check for exit (sell) signal.
@@ -251,15 +260,16 @@ class SignalGenerator:
             df: DataFrame with indicators
             entry_price: Entry price for stop loss calculation
             stop_loss_pct: Stop loss percentage
+            idx: Position of the bar to evaluate (default: last bar)
 
         Returns:
             Signal if exit conditions met, None otherwise
         """
-        if len(df) < 2:
+        if _bars_through(df, idx) < 2:
             return None
 
-        latest = df.iloc[-1]
-        timestamp = df.index[-1]
+        latest = df.iloc[idx]
+        timestamp = df.index[idx]
 
         # Helper to get indicator values
         def get_indicators():
@@ -323,6 +333,7 @@ class SignalGenerator:
         self,
         df: pd.DataFrame,
         has_position: bool = False,
+        idx: int = -1,
     ) -> Optional[Signal]:
         """
         Check for hedge/short entry signal.
@@ -338,6 +349,7 @@ class SignalGenerator:
         Args:
             df: DataFrame with indicators
             has_position: Whether currently holding any position
+            idx: Position of the bar to evaluate (default: last bar)
 
         Returns:
             Signal if hedge/short entry conditions met, None otherwise
@@ -349,11 +361,11 @@ class SignalGenerator:
             return None
 
         min_period = max(self.sma_period, self.bb_period, self.volume_avg_period)
-        if len(df) < min_period:
+        if _bars_through(df, idx) < min_period:
             return None
 
-        latest = df.iloc[-1]
-        timestamp = df.index[-1]
+        latest = df.iloc[idx]
+        timestamp = df.index[idx]
 
         sma_col = f"sma_{self.sma_period}"
 
@@ -436,6 +448,7 @@ class SignalGenerator:
         is_hedge: bool = False,
         hedge_entry_price: float = 0.0,
         current_hedge_price: Optional[float] = None,
+        idx: int = -1,
     ) -> Optional[Signal]:
         """
         Check for hedge/short exit signal.
@@ -455,15 +468,16 @@ class SignalGenerator:
             is_hedge: Whether this is a hedge position (SQQQ)
             hedge_entry_price: SQQQ entry price for stop loss calculation
             current_hedge_price: Current SQQQ price for stop loss check
+            idx: Position of the bar to evaluate (default: last bar)
 
         Returns:
             Signal if exit conditions met, None otherwise
         """
-        if len(df) < 2:
+        if _bars_through(df, idx) < 2:
             return None
 
-        latest = df.iloc[-1]
-        timestamp = df.index[-1]
+        latest = df.iloc[idx]
+        timestamp = df.index[idx]
 
         # Determine signal type and symbol based on position type
         if is_hedge or self.use_inverse_etf:
@@ -551,6 +565,51 @@ class SignalGenerator:
 
         return None
 
+    def entry_candidates(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flag bars where a long or hedge/short entry signal could fire.
+
+        Only the required RSI/SMA conditions are checked, over the whole frame
+        at once. Optional filters and the Signal itself are still evaluated
+        per bar, so a backtest can skip every bar that isn't flagged.
+
+        Args:
+            df: DataFrame with indicators
+
+        Returns:
+            Boolean array aligned with df
+        """
+        sma_col = f"sma_{self.sma_period}"
+        if sma_col not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+
+        close = df["close"].to_numpy()
+        rsi = df["rsi"].to_numpy()
+        sma = df[sma_col].to_numpy()
+        has_sma = ~np.isnan(sma)
+
+        # Negated comparisons keep NaN RSI flagged, as the per-bar checks do
+        candidates = has_sma & ~(rsi > self.rsi_oversold)
+        if self.short_enabled:
+            candidates |= has_sma & ~(rsi < self.rsi_overbought_short) & (close > sma)
+        return candidates
+
+    def exit_candidates(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flag bars where a long position exits on breakout or RSI overbought.
+
+        The stop loss depends on the entry price, so callers still check it
+        per bar for unflagged bars.
+
+        Args:
+            df: DataFrame with indicators
+
+        Returns:
+            Boolean array aligned with df
+        """
+        close = df["close"].to_numpy()
+        return (close > df["prev_high"].to_numpy()) | (df["rsi"].to_numpy() >= self.rsi_overbought)
+
     def generate_signals(
         self,
         df: pd.DataFrame,
@@ -561,6 +620,7 @@ class SignalGenerator:
         short_stop_loss_pct: Optional[float] = None,
         hedge_entry_price: Optional[float] = None,
         current_hedge_price: Optional[float] = None,
+        idx: int = -1,
     ) -> Optional[Signal]:
         """
         Generate trading signal based on current state.
@@ -574,6 +634,8 @@ class SignalGenerator:
             short_stop_loss_pct: Stop loss percentage for short/hedge positions
             hedge_entry_price: SQQQ entry price for hedge stop loss calculation
             current_hedge_price: Current SQQQ price for hedge stop loss check
+            idx: Position of the bar to evaluate (default: last bar); lets a
+                backtest pass the full frame instead of slicing it per bar
 
         Returns:
             Trading signal or None
@@ -593,21 +655,22 @@ class SignalGenerator:
                     is_hedge=True,
                     hedge_entry_price=hedge_entry_price or 0.0,
                     current_hedge_price=current_hedge_price,
+                    idx=idx,
                 )
             elif position_side == "short":
                 # Direct short position: TQQQ short
-                return self.generate_short_exit_signal(df, entry_price, short_sl, is_hedge=False)
+                return self.generate_short_exit_signal(df, entry_price, short_sl, is_hedge=False, idx=idx)
             else:
                 # Long position: TQQQ long
-                return self.generate_exit_signal(df, entry_price, stop_loss_pct)
+                return self.generate_exit_signal(df, entry_price, stop_loss_pct, idx=idx)
         else:
             # Try long entry first, then hedge/short
-            long_signal = self.generate_entry_signal(df, has_position)
+            long_signal = self.generate_entry_signal(df, has_position, idx=idx)
             if long_signal:
                 return long_signal
 
             # Try hedge/short entry if enabled
             if self.short_enabled:
-                return self.generate_short_entry_signal(df, has_position)
+                return self.generate_short_entry_signal(df, has_position, idx=idx)
 
             return None
@@ -138,16 +138,17 @@ def mock_broker(mock_alpaca_account, mock_alpaca_position):
 
 @pytest.fixture
 def mock_discord_notifier():
-    """Create a mocked DiscordNotifier with tracked requests."""
-    with patch("notifications.discord.requests") as mock_requests:
+    """Create a mocked DiscordNotifier with a tracked webhook session."""
+    with patch("notifications.discord.get_webhook_session") as mock_get_session:
+        mock_session = mock_get_session.return_value
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.raise_for_status = Mock()
-        mock_requests.post.return_value = mock_response
+        mock_session.post.return_value = mock_response
 
         from notifications.discord import DiscordNotifier
         notifier = DiscordNotifier(webhook_url="https://discord.com/api/webhooks/test/test")
-        yield notifier, mock_requests
+        yield notifier, mock_session
 
 
 @pytest.fixture
@@ -0,0 +1 @@
+# Automation tests package
@@ -0,0 +1,335 @@
+"""
+Tests for ClaudeAnalyzer prompt building and response parsing.
+"""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.fixture
+def analyzer():
+    """Create ClaudeAnalyzer with mocked collaborators and RAG disabled."""
+    from automation.claude_analyzer import ClaudeAnalyzer
+
+    analyzer = ClaudeAnalyzer(
+        firestore_client=None,
+        report_generator=Mock(),
+        discord_notifier=Mock(enabled=False),
+    )
+    analyzer.rag_retriever = None
+    analyzer.regime_classifier = None
+    return analyzer
+
+
+@pytest.fixture
+def sample_report():
+    """Create a minimal analysis report."""
+    from reports.report_generator import AnalysisReport
+
+    return AnalysisReport(
+        report_id="test_report",
+        generated_at="2024-12-23T16:30:00",
+        strategy={"rsi_oversold": 30.0, "rsi_overbought": 75.0},
+        market_condition={"rsi": 42.0},
+        todays_trades=[],
+        recent_performance={"total_trades": 0},
+        recommendations_context="No trades today",
+    )
+
+
+def _result(summary: str, modifications: list | None = None) -> dict:
+    return {"summary": summary, "modifications": modifications or [], "confidence": 0.8}
+
+
+class TestBuildPrompt:
+    """Test single-report prompt building."""
+
+    def test_matches_template_format(self, analyzer, sample_report):
+        """Verify the segment-joined prompt equals formatting the template."""
+        from automation.claude_analyzer import _json_dumps_indented
+
+        expected = analyzer.ANALYSIS_PROMPT_TEMPLATE.format(
+            strategy_json=_json_dumps_indented(sample_report.strategy),
+            market_json=_json_dumps_indented(sample_report.market_condition),
+            trades_json=_json_dumps_indented(sample_report.todays_trades),
+            performance_json=_json_dumps_indented(sample_report.recent_performance),
+            context=sample_report.recommendations_context,
+            rag_context="(RAG not available - no historical context)",
+        )
+
+        assert analyzer.build_prompt(sample_report) == expected
+
+
+class TestParseResponse:
+    """Test single-report response parsing."""
+
+    def test_parses_fenced_json(self, analyzer):
+        """Verify JSON inside a markdown fence is parsed."""
+        mod = {"parameter": "rsi_oversold", "old_value": 30, "new_value": 35, "reason": "test"}
+        response = f"Here you go:\n```json\n{json.dumps(_result('ok', [mod]))}\n```"
+
+        result = analyzer.parse_response(response)
+
+        assert result is not None
+        assert result.summary == "ok"
+        assert result.modifications[0].parameter == "rsi_oversold"
+        assert result.modifications[0].new_value == 35
+
+    def test_returns_none_without_json(self, analyzer):
+        """Verify None when the response has no JSON."""
+        assert analyzer.parse_response("I could not analyze this.") is None
+
+    def test_falls_back_to_raw_object(self, analyzer):
+        """Verify a bare JSON object surrounded by prose is parsed."""
+        response = f"Analysis follows. {json.dumps(_result('raw'))} Let me know."
+
+        result = analyzer.parse_response(response)
+
+        assert result is not None
+        assert result.summary == "raw"
+
+    def test_unclosed_braces_return_none(self, analyzer):
+        """Verify a response of unmatched braces is rejected without a match."""
+        assert analyzer.parse_response("{" * 50_000) is None
+
+    def test_returns_none_on_missing_key(self, analyzer):
+        """Verify None when a modification is missing a key."""
+        response = json.dumps(_result("bad", [{"parameter": "rsi_oversold"}]))
+        assert analyzer.parse_response(response) is None
+
+
+class TestBatchAnalysis:
+    """Test batched multi-report analysis."""
+
+    def test_batch_prompt_contains_each_report(self, analyzer, sample_report):
+        """Verify every report gets its own section."""
+        prompt = analyzer.build_batch_prompt([sample_report, sample_report, sample_report])
+
+        assert "## Report 1" in prompt
+        assert "## Report 3" in prompt
+        assert "3 daily reports" in prompt
+
+    def test_parse_batch_response(self, analyzer):
+        """Verify results are parsed in order."""
+        response = json.dumps({"results": [_result("first"), _result("second")]})
+
+        results = analyzer.parse_batch_response(response)
+
+        assert [r.summary for r in results] == ["first", "second"]
+
+    def test_parse_batch_response_rejects_bad_shape(self, analyzer):
+        """Verify None when results is missing or not a list."""
+        assert analyzer.parse_batch_response(json.dumps({"summary": "x"})) is None
+        assert analyzer.parse_batch_response(json.dumps({"results": "x"})) is None
+
+    def test_analyze_many_uses_single_call(self, analyzer, sample_report):
+        """Verify a batch is analyzed with one Claude invocation."""
+        response = json.dumps({"results": [_result("a"), _result("b")]})
+        analyzer.call_claude = Mock(return_value=response)
+
+        results = analyzer.analyze_many([sample_report, sample_report])
+
+        assert len(results) == 2
+        analyzer.call_claude.assert_called_once()
+
+    def test_analyze_many_rejects_count_mismatch(self, analyzer, sample_report):
+        """Verify an empty list when results cannot be paired with reports."""
+        response = json.dumps({"results": [_result("a")]})
+        analyzer.call_claude = Mock(return_value=response)
+
+        assert analyzer.analyze_many([sample_report, sample_report]) == []
+
+    def test_analyze_many_empty(self, analyzer):
+        """Verify no Claude call for an empty batch."""
+        analyzer.call_claude = Mock()
+
+        assert analyzer.analyze_many([]) == []
+        analyzer.call_claude.assert_not_called()
+
+
+class TestApplyModifications:
+    """Test applying Claude's modifications to a strategy config."""
+
+    def test_limits_change_and_clamps_range(self, analyzer):
+        """Verify numeric changes are capped per analysis and kept in range."""
+        from automation.claude_analyzer import StrategyModification
+        from config.settings import StrategyConfig
+
+        config = StrategyConfig(stop_loss_pct=0.05, rsi_oversold=10.0)
+        mods = [
+            StrategyModification("stop_loss_pct", 0.05, 0.5, "wider"),
+            StrategyModification("rsi_oversold", 10.0, 1.0, "lower"),
+        ]
+
+        new_config = analyzer.apply_modifications(config, mods)
+
+        assert new_config.stop_loss_pct == pytest.approx(0.15)
+        assert new_config.rsi_oversold == 5.0
+        assert config.stop_loss_pct == 0.05
+
+    def test_boolean_and_unknown_params(self, analyzer):
+        """Verify toggles accept strings and unknown parameters are ignored."""
+        from automation.claude_analyzer import StrategyModification
+        from config.settings import StrategyConfig
+
+        config = StrategyConfig(short_enabled=False)
+        mods = [
+            StrategyModification("short_enabled", 0, "true", "enable"),
+            StrategyModification("symbol", 0, 1, "immutable"),
+        ]
+
+        new_config = analyzer.apply_modifications(config, mods)
+
+        assert new_config.short_enabled is True
+        assert new_config.symbol == config.symbol
+
+
+class TestSaveStrategyChange:
+    """Test strategy change persistence."""
+
+    def test_skips_save_when_config_unchanged(self, analyzer, sample_report):
+        """Verify no Firestore writes when modifications are no-ops."""
+        from automation.claude_analyzer import AnalysisResult
+        from config.settings import StrategyConfig
+
+        analyzer.firestore = Mock()
+        config = StrategyConfig()
+        analysis = AnalysisResult(summary="noop", modifications=[], confidence=1.0, raw_response="")
+
+        result = analyzer.save_strategy_change(config, StrategyConfig(), analysis, sample_report)
+
+        assert result is None
+        analyzer.firestore.create_strategy.assert_not_called()
+
+
+class TestCooldown:
+    """Test cooldown handling in analyze()."""
+
+    def test_skips_claude_during_cooldown(self, analyzer, sample_report):
+        """Verify Claude is not called while a recent change is cooling down."""
+        from datetime import datetime, timezone
+
+        analyzer.firestore = Mock()
+        analyzer.firestore.get_last_strategy_change_time.return_value = datetime.now(timezone.utc)
+        analyzer.call_claude = Mock()
+
+        result = analyzer.analyze(report=sample_report, auto_apply=True, cooldown_days=3)
+
+        assert result is not None
+        assert result.modifications == []
+        analyzer.call_claude.assert_not_called()
+
+    def test_calls_claude_after_cooldown(self, analyzer, sample_report):
+        """Verify Claude is called once the cooldown has elapsed."""
+        from datetime import datetime, timedelta, timezone
+
+        analyzer.firestore = Mock()
+        analyzer.firestore.get_last_strategy_change_time.return_value = (
+            datetime.now(timezone.utc) - timedelta(days=5)
+        )
+        analyzer.call_claude = Mock(return_value=None)
+
+        analyzer.analyze(report=sample_report, auto_apply=True, cooldown_days=3)
+
+        analyzer.call_claude.assert_called_once()
+
+    def test_advisory_analysis_during_cooldown(self, analyzer, sample_report):
+        """Verify advisory mode calls Claude but applies nothing."""
+        from datetime import datetime, timezone
+
+        mod = {"parameter": "rsi_oversold", "old_value": 30, "new_value": 35, "reason": "test"}
+        analyzer.firestore = Mock()
+        analyzer.firestore.get_last_strategy_change_time.return_value = datetime.now(timezone.utc)
+        analyzer.call_claude = Mock(return_value=json.dumps(_result("advice", [mod])))
+        analyzer.save_strategy_change = Mock()
+
+        result = analyzer.analyze(
+            report=sample_report, auto_apply=True, cooldown_days=3, advise_during_cooldown=True
+        )
+
+        assert result.summary == "advice"
+        analyzer.save_strategy_change.assert_not_called()
+
+
+class TestAnalyzeNotifications:
+    """Test Discord messages sent by analyze()."""
+
+    def test_notify_false_posts_nothing(self, analyzer, sample_report):
+        """Verify callers that report the result themselves get no extra posts."""
+        analyzer.discord = Mock(enabled=True)
+        analyzer.call_claude = Mock(return_value=json.dumps(_result("quiet")))
+
+        result = analyzer.analyze(report=sample_report, notify=False)
+
+        assert result.summary == "quiet"
+        analyzer.discord.send_message.assert_not_called()
+
+    @pytest.mark.parametrize("configured, rsi_delta, status", [
+        (False, 5, "Firestore not configured"),
+        (True, 0, "No effective change"),
+        (True, 5, "Changes Applied** (`strat_new`)"),
+    ])
+    def test_apply_status_reflects_save(self, analyzer, sample_report, configured, rsi_delta, status):
+        """Verify the result message reports what save_strategy_change did."""
+        from config.settings import get_settings
+
+        current = get_settings().strategy.rsi_oversold
+        mod = {
+            "parameter": "rsi_oversold",
+            "old_value": current,
+            "new_value": current + rsi_delta,
+            "reason": "test",
+        }
+        if configured:
+            analyzer.firestore = Mock()
+            analyzer.firestore.get_last_strategy_change_time.return_value = None
+            analyzer.firestore.get_active_strategy.return_value = None
+            analyzer.firestore.create_strategy.return_value = "strat_new"
+        analyzer.discord = Mock(enabled=True)
+        analyzer.call_claude = Mock(return_value=json.dumps(_result("tune", [mod])))
+
+        analyzer.analyze(report=sample_report, auto_apply=True)
+
+        assert status in analyzer.discord.send_message.call_args.args[0]
+
+
+class TestLenientParsing:
+    """Test the JSON5 fallback for malformed responses."""
+
+    def test_trailing_comma_response(self, analyzer):
+        """Verify trailing commas and comments parse via the lenient fallback."""
+        pytest.importorskip("pyjson5")
+
+        response = (
+            "```json\n"
+            '{"summary": "ok", // 요약\n'
+            ' "modifications": [], "confidence": 0.6,}\n'
+            "```"
+        )
+
+        result = analyzer.parse_response(response)
+
+        assert result is not None
+        assert result.confidence == 0.6
+
+
+class TestCallClaude:
+    """Test Claude CLI invocation."""
+
+    def test_prompt_sent_via_stdin(self, analyzer):
+        """Verify the prompt is piped through stdin, not argv."""
+        from unittest.mock import patch
+
+        completed = Mock(returncode=0, stdout=" response \n", stderr="")
+        with patch("automation.claude_analyzer.subprocess.run", return_value=completed) as mock_run:
+            result = analyzer.call_claude("a long prompt")
+
+        assert result == "response"
+        args, kwargs = mock_run.call_args
+        assert "a long prompt" not in args[0]
+        assert kwargs["input"] == "a long prompt"
@@ -6,6 +6,8 @@ Run: python test_backtest.py
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -95,6 +97,107 @@ def test_synthetic_backtest():
         return False
 
 
+def _synthetic_frames(strategy):
+    """Synthetic TQQQ bars with indicators, plus an inverse series for the hedge leg."""
+    from data.fetcher import DataFetcher
+    from strategy.indicators import add_all_indicators
+
+    raw = DataFetcher()._generate_synthetic_data("TQQQ", "2015-01-01", "2024-12-31")
+    hedge = raw.copy()
+    # Inverse prices: the hedge's high comes from the primary's low and vice versa
+    hedge[["open", "high", "low", "close", "vwap"]] = (
+        2000.0 / raw[["open", "low", "high", "close", "vwap"]].to_numpy()
+    )
+    df = add_all_indicators(raw, rsi_period=strategy.rsi_period, sma_period=strategy.sma_period)
+    return df, hedge
+
+
+# Pinned from the per-bar Portfolio/SignalGenerator loop before it was moved
+# onto arrays and masks: (overrides, trades by side, final equity,
+# equity curve sum, first trade of the non-long side as (entry, exit))
+_SIMULATE_CASES = {
+    "long_only": (
+        {"short_enabled": False},
+        {"BUY": 264}, 78720.4582024305, 110532801.59699622, None,
+    ),
+    "inverse_etf_hedge": (
+        {"short_enabled": True, "use_inverse_etf": True},
+        {"BUY": 255, "HEDGE": 117}, 62362.8054171951, 93606181.58843598,
+        (64.34425271138147, 60.29739249389775),
+    ),
+    "direct_short": (
+        {"short_enabled": True, "use_inverse_etf": False},
+        {"BUY": 256, "SHORT": 120}, 82308.91008471335, 122748682.68133423,
+        (31.082776094565347, 33.16889698343763),
+    ),
+}
+
+
+@pytest.mark.parametrize("case", list(_SIMULATE_CASES))
+def test_simulate_regression(case, monkeypatch):
+    """Verify the simulation loop reproduces pinned trades and equity."""
+    from collections import Counter
+
+    from backtest.engine import BacktestEngine
+    from config.settings import get_settings
+    from execution.portfolio import Portfolio
+
+    overrides, sides, final_equity, equity_sum, other_side = _SIMULATE_CASES[case]
+    strategy = get_settings().strategy
+    for key, value in overrides.items():
+        monkeypatch.setattr(strategy, key, value)
+
+    engine = BacktestEngine(initial_capital=10000.0)
+    df, hedge = _synthetic_frames(strategy)
+    use_hedge = strategy.short_enabled and strategy.use_inverse_etf
+    equity, trades = engine._simulate(
+        df, Portfolio(initial_capital=10000.0), "TQQQ",
+        hedge_df=hedge if use_hedge else None,
+    )
+
+    assert len(equity) == len(df) - strategy.sma_period
+    assert equity.iloc[-1] == pytest.approx(final_equity, rel=1e-12)
+    assert equity.sum() == pytest.approx(equity_sum, rel=1e-12)
+    assert Counter(t.side for t in trades) == sides
+
+    # Every configuration opens and closes its first and last long trade alike
+    first, last = trades[0], trades[-1]
+    assert (first.entry_price, first.exit_price) == pytest.approx((35.075647954380194, 34.72604610755503))
+    assert (last.entry_price, last.exit_price) == pytest.approx((13352.49484118115, 11696.554761749758))
+    assert last.exit_reason.startswith("Stop loss triggered")
+
+    if other_side is not None:
+        trade = next(t for t in trades if t.side != "BUY")
+        assert (trade.entry_price, trade.exit_price) == pytest.approx(other_side)
+
+
+def test_grid_search_parallel_matches_serial():
+    """Verify pooled and in-process grid search agree and leave settings alone."""
+    from dataclasses import asdict
+
+    from backtest.optimizer import StrategyOptimizer
+    from config.settings import get_settings
+
+    strategy = get_settings().strategy
+    before = asdict(strategy)
+    optimizer = StrategyOptimizer(start_date="2022-01-01", end_date="2023-12-31")
+    grid = {
+        "rsi_periods": [2, 3],
+        "rsi_oversold_levels": [10, 20],
+        "rsi_overbought_levels": [70],
+        "stop_loss_pcts": [0.05],
+    }
+
+    serial = optimizer.grid_search(**grid, max_workers=1)
+    assert asdict(strategy) == before
+    parallel = optimizer.grid_search(**grid, max_workers=2)
+
+    assert len(serial.all_results) == 4
+    assert parallel.all_results == serial.all_results
+    assert parallel.best_params == serial.best_params
+    assert asdict(strategy) == before
+
+
 if __name__ == "__main__":
     success = test_synthetic_backtest()
     sys.exit(0 if success else 1)
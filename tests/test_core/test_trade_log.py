@@ -0,0 +1,182 @@
+"""
+Tests for trade log access.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import trade_log
+from core.trade_log import (
+    append_trade,
+    is_json_array_log,
+    iter_trades,
+    iter_trades_reverse,
+    trades_between,
+    trades_on_date,
+    write_trades,
+)
+
+
+def _trades(count: int) -> list[dict]:
+    return [
+        {"timestamp_utc": f"2024-01-{1 + i // 3:02d}T1{i % 3}:00:00Z", "id": i}
+        for i in range(count)
+    ]
+
+
+def _write_ndjson(path: Path, trades: list[dict]) -> None:
+    path.write_text("".join(json.dumps(t) + "\n" for t in trades))
+
+
+class TestIterTrades:
+    """Test forward and reverse iteration."""
+
+    def test_reads_ndjson_and_array_alike(self, tmp_path):
+        """Verify both log formats yield the same trades."""
+        trades = _trades(5)
+        ndjson_file = tmp_path / "trades.jsonl"
+        array_file = tmp_path / "trades.json"
+        _write_ndjson(ndjson_file, trades)
+        array_file.write_text(json.dumps(trades, indent=2))
+
+        assert list(iter_trades(str(ndjson_file))) == trades
+        assert list(iter_trades(str(array_file))) == trades
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_reads_array_without_ijson(self, tmp_path, monkeypatch, orjson_available):
+        """Verify the whole-file array parse (mmap with orjson, json.load without)."""
+        if orjson_available and not trade_log.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(trade_log, "IJSON_AVAILABLE", False)
+        monkeypatch.setattr(trade_log, "ORJSON_AVAILABLE", orjson_available)
+        trades = _trades(5)
+        array_file = tmp_path / "trades.json"
+        array_file.write_text(json.dumps(trades, indent=2))
+
+        assert list(iter_trades(str(array_file))) == trades
+        assert trades_between(str(array_file), "2000-01-01") == trades
+
+    def test_reverse_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        """Verify reverse reads reassemble lines split between blocks."""
+        monkeypatch.setattr(trade_log, "_REVERSE_CHUNK", 16)
+        trades = _trades(10)
+        trades_file = tmp_path / "trades.jsonl"
+        _write_ndjson(trades_file, trades)
+
+        assert list(iter_trades_reverse(str(trades_file))) == trades[::-1]
+
+    def test_reverse_without_trailing_newline(self, tmp_path):
+        """Verify the last record is read when the file lacks a final newline."""
+        trades = _trades(3)
+        trades_file = tmp_path / "trades.jsonl"
+        trades_file.write_text("\n".join(json.dumps(t) for t in trades))
+
+        assert list(iter_trades_reverse(str(trades_file))) == trades[::-1]
+
+    def test_invalid_record_raises_decode_error(self, tmp_path):
+        """Verify malformed lines surface as JSONDecodeError."""
+        trades_file = tmp_path / "trades.jsonl"
+        trades_file.write_text("not valid json\n")
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_trades(str(trades_file)))
+
+
+class TestTradesOnDate:
+    """Test date-sliced reads."""
+
+    def test_stops_at_older_trades(self, tmp_path, monkeypatch):
+        """Verify the NDJSON scan only decodes records on the date."""
+        trades = _trades(9)
+        trades_file = tmp_path / "trades.jsonl"
+        _write_ndjson(trades_file, trades)
+
+        decoded = []
+        real_loads = trade_log._json_loads
+
+        def counting_loads(line):
+            decoded.append(line)
+            return real_loads(line)
+
+        monkeypatch.setattr(trade_log, "_json_loads", counting_loads)
+
+        result = trades_on_date(str(trades_file), "2024-01-03")
+
+        assert [t["id"] for t in result] == [6, 7, 8]
+        assert len(decoded) == 3
+
+    def test_array_log_filtered_in_full(self, tmp_path):
+        """Verify unordered legacy array logs still match every trade."""
+        trades = [
+            {"timestamp_utc": "2024-01-02T10:00:00Z"},
+            {"timestamp_utc": "2024-01-01T10:00:00Z"},
+            {"timestamp_utc": "2024-01-02T14:00:00Z"},
+        ]
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps(trades))
+
+        assert len(trades_on_date(str(trades_file), "2024-01-02")) == 2
+
+    def test_range_skips_newer_and_stops_at_older(self, tmp_path):
+        """Verify a date range excludes trades on either side."""
+        trades_file = tmp_path / "trades.jsonl"
+        _write_ndjson(trades_file, _trades(12))
+
+        result = trades_between(str(trades_file), "2024-01-02", "2024-01-03")
+
+        assert [t["id"] for t in result] == [3, 4, 5, 6, 7, 8]
+
+    def test_unpeekable_timestamps_are_decoded(self, tmp_path):
+        """Verify records without a string timestamp fall back to decoding."""
+        trades_file = tmp_path / "trades.jsonl"
+        trades_file.write_text(
+            '{"timestamp_utc":"2024-01-01T10:00:00Z","id":0}\n'
+            '{"id":1,"timestamp_utc":null,"note":"2024-01-02"}\n'
+            '{"id":2,"timestamp_utc" : "2024-01-02T10:00:00Z"}\n'
+        )
+
+        result = trades_between(str(trades_file), "2024-01-02", "2024-01-02")
+
+        assert [t["id"] for t in result] == [2]
+
+        # An empty timestamp mustn't end the scan before older in-range trades
+        trades_file.write_text(
+            '{"timestamp_utc":"2024-01-02T10:00:00Z","id":0}\n'
+            '{"timestamp_utc":"","id":1}\n'
+            '{"timestamp_utc":"2024-01-03T10:00:00Z","id":2}\n'
+        )
+
+        result = trades_between(str(trades_file), "2024-01-01", "2024-01-05")
+
+        assert [t["id"] for t in result] == [0, 2]
+
+
+class TestWriters:
+    """Test NDJSON writers and legacy log migration."""
+
+    def test_append_after_write(self, tmp_path):
+        """Verify appended trades follow rewritten ones as NDJSON lines."""
+        trades_file = str(tmp_path / "trades.json")
+
+        assert write_trades(trades_file, _trades(2)) == 2
+        append_trade(trades_file, {"timestamp_utc": "2024-01-02T10:00:00Z", "id": 2})
+
+        assert not is_json_array_log(trades_file)
+        assert [t["id"] for t in iter_trades_reverse(trades_file)] == [2, 1, 0]
+
+    def test_trade_logger_converts_array_log(self, tmp_path):
+        """Verify TradeLogger rewrites a legacy array log before appending."""
+        from logging_system.trade_logger import TradeLogger
+
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps(_trades(3), indent=2))
+
+        trade_logger = TradeLogger(log_dir=tmp_path)
+
+        assert trade_logger.get_trade_count() == 3
+        assert not is_json_array_log(str(trades_file))
+        assert list(iter_trades(str(trades_file))) == _trades(3)
@@ -41,6 +41,22 @@ class TestSchedulerLoopSafety:
         assert not thread.is_alive(), "Scheduler did not stop within timeout"
         assert scheduler._running == False
 
+    def test_stop_wakes_long_wait(self, mock_scheduler):
+        """Verify stop() interrupts a long wait instead of waiting it out."""
+        scheduler = mock_scheduler
+        scheduler.get_next_run_time = Mock(return_value=datetime.now(ET) + timedelta(hours=6))
+
+        thread = threading.Thread(target=scheduler.run_loop)
+        thread.start()
+        time.sleep(0.2)
+
+        started = time.monotonic()
+        scheduler.stop()
+        thread.join(timeout=5.0)
+
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 1.0
+
     def test_stop_method_sets_running_false(self, mock_scheduler):
         """Verify stop() method sets _running to False."""
         scheduler = mock_scheduler
@@ -153,6 +169,54 @@ class TestSchedulerNextRunTime:
         assert next_run is not None
         assert next_run.weekday() == 0  # Monday
 
+    def test_get_next_run_time_with_unsorted_times(self, mock_scheduler):
+        """Verify configured times are ordered and an exact match moves on."""
+        from automation.scheduler import ScheduleConfig
+
+        scheduler = mock_scheduler
+        scheduler.config = ScheduleConfig(analysis_times=[(15, 0), (10, 0), (12, 0)])
+
+        test_time = ET.localize(datetime(2024, 12, 23, 10, 0))
+        next_run = scheduler.get_next_run_time(after=test_time)
+
+        assert (next_run.hour, next_run.minute) == (12, 0)
+
+    def test_get_next_run_time_after_schedule_change(self, mock_scheduler):
+        """Verify times added after construction are picked up."""
+        from automation.scheduler import ScheduleConfig
+
+        scheduler = mock_scheduler
+        scheduler.config = ScheduleConfig(analysis_times=[(15, 0)])
+        test_time = ET.localize(datetime(2024, 12, 23, 10, 0))
+        assert scheduler.get_next_run_time(after=test_time).hour == 15
+
+        scheduler.config.analysis_times.append((11, 0))
+
+        assert scheduler.get_next_run_time(after=test_time).hour == 11
+
+    def test_empty_analysis_times_rejected(self):
+        """Verify a schedule with no analysis times fails at construction."""
+        from automation.scheduler import ScheduleConfig
+
+        with pytest.raises(ValueError):
+            ScheduleConfig(analysis_times=[])
+
+
+class TestSchedulerAnalysisPurpose:
+    """Test analysis purpose labelling."""
+
+    def test_purpose_from_given_time(self, mock_scheduler):
+        """Verify the purpose follows the time passed in."""
+        scheduler = mock_scheduler
+
+        morning = ET.localize(datetime(2024, 1, 15, 9, 0))
+        midday = ET.localize(datetime(2024, 1, 15, 12, 0))
+        evening = ET.localize(datetime(2024, 1, 15, 16, 30))
+
+        assert scheduler._get_analysis_purpose(morning)[0] == "Pre-Market Check"
+        assert scheduler._get_analysis_purpose(midday)[0] == "Intraday Check"
+        assert scheduler._get_analysis_purpose(evening)[0] == "Post-Market Analysis"
+
 
 class TestSchedulerAnalysisTimeout:
     """Test scheduler analysis timeout handling."""
@@ -186,6 +250,102 @@ class TestSchedulerAnalysisTimeout:
         assert result is None
 
 
+class TestSchedulerReportCache:
+    """Test report reuse between back-to-back analysis runs."""
+
+    def test_report_reused_within_window(self, mock_scheduler):
+        """Verify a second run in the same window skips report generation."""
+        scheduler = mock_scheduler
+        scheduler.config.dry_run = True
+
+        scheduler.run_analysis()
+        scheduler.run_analysis()
+
+        scheduler.report_gen.generate_report.assert_called_once()
+        scheduler.report_gen.save_report.assert_called_once()
+
+    def test_report_regenerated_in_new_window(self, mock_scheduler):
+        """Verify the report is rebuilt once the cache window rolls over."""
+        from automation.scheduler import REPORT_CACHE_SECONDS
+
+        scheduler = mock_scheduler
+        now = ET.localize(datetime(2024, 12, 23, 10, 0))
+
+        scheduler._get_report(now)
+        scheduler._get_report(now + timedelta(seconds=REPORT_CACHE_SECONDS))
+
+        assert scheduler.report_gen.generate_report.call_count == 2
+
+    def test_modifications_invalidate_cached_report(self, mock_scheduler):
+        """Verify suggested changes force a fresh report on the next run."""
+        scheduler = mock_scheduler
+        scheduler.config.dry_run = False
+        scheduler.analyzer.analyze.return_value = Mock(
+            summary="Tighten RSI",
+            confidence=0.9,
+            modifications=[Mock(parameter="rsi_oversold", old_value=30, new_value=28)],
+        )
+
+        scheduler.run_analysis()
+        scheduler.run_analysis()
+
+        assert scheduler.report_gen.generate_report.call_count == 2
+
+
+class TestSchedulerNotifications:
+    """Test Discord messages sent per analysis cycle."""
+
+    def _enable_analysis(self, scheduler):
+        scheduler.config.dry_run = False
+        scheduler.discord.enabled = True
+        scheduler.analyzer.analyze.return_value = Mock(
+            summary="Hold steady", confidence=0.8, modifications=[]
+        )
+
+    def test_single_message_per_cycle(self, mock_scheduler):
+        """Verify the result message carries the start time."""
+        scheduler = mock_scheduler
+        self._enable_analysis(scheduler)
+
+        scheduler.run_analysis()
+
+        scheduler.discord.send_message.assert_called_once()
+        message = scheduler.discord.send_message.call_args.args[0]
+        assert "Complete" in message
+        assert "Started:" in message
+        assert scheduler.analyzer.analyze.call_args.kwargs["notify"] is False
+
+    def test_start_message_when_configured(self, mock_scheduler):
+        """Verify notify_start restores the separate start message."""
+        scheduler = mock_scheduler
+        self._enable_analysis(scheduler)
+        scheduler.config.notify_start = True
+
+        scheduler.run_analysis()
+
+        assert scheduler.discord.send_message.call_count == 2
+
+    def test_result_message_lists_modifications(self, mock_scheduler):
+        """Verify each modification gets its own line and applied status shows."""
+        scheduler = mock_scheduler
+        scheduler.config.auto_apply = True
+        result = Mock(
+            summary="Tighten entries",
+            confidence=0.9,
+            modifications=[
+                Mock(parameter="rsi_oversold", old_value=30, new_value=28),
+                Mock(parameter="stop_loss_pct", old_value=0.02, new_value=0.015),
+            ],
+        )
+        started = ET.localize(datetime(2024, 12, 23, 11, 0))
+
+        message = scheduler._format_result_message(result, "Intraday Check", "📊", started)
+
+        assert "• `rsi_oversold`: 30 → 28\n" in message
+        assert "• `stop_loss_pct`: 0.02 → 0.015\n" in message
+        assert message.endswith("✅ **Changes Applied**")
+
+
 class TestSchedulerRunLoop:
     """Test scheduler run loop behavior."""
 
@@ -193,22 +353,46 @@ class TestSchedulerRunLoop:
         """Verify loop sleeps between run time checks (not spinning CPU)."""
         scheduler = mock_scheduler
 
-        sleep_calls = []
+        wait_calls = []
 
-        def track_sleep(seconds):
-            sleep_calls.append(seconds)
-            if len(sleep_calls) >= 3:
+        def track_wait(seconds):
+            wait_calls.append(seconds)
+            if len(wait_calls) >= 3:
                 scheduler.stop()
+            return not scheduler._running
 
         # Mock get_next_run_time to return a time in the future
         future_time = datetime.now(ET) + timedelta(hours=1)
         scheduler.get_next_run_time = Mock(return_value=future_time)
 
-        with patch("time.sleep", side_effect=track_sleep):
+        with patch.object(scheduler._stop_event, "wait", side_effect=track_wait):
+            scheduler.run_loop()
+
+        # Waits for the whole gap in one call instead of 60-second chunks
+        assert len(wait_calls) >= 1, "Scheduler should sleep while waiting"
+        assert wait_calls[0] > 3000
+
+    def test_run_loop_rewaits_if_wall_clock_lags(self, mock_scheduler):
+        """Verify a wait that ends before the wall-clock run time waits again."""
+        scheduler = mock_scheduler
+        scheduler.get_next_run_time = Mock(return_value=datetime.now(ET) + timedelta(minutes=10))
+        scheduler.run_analysis = Mock()
+
+        wait_calls = []
+
+        def early_wake(seconds):
+            # Returns without the wall clock advancing, as after an NTP step back
+            wait_calls.append(seconds)
+            if len(wait_calls) >= 2:
+                scheduler.stop()
+            return not scheduler._running
+
+        with patch.object(scheduler._stop_event, "wait", side_effect=early_wake):
             scheduler.run_loop()
 
-        # Should have slept multiple times (60 seconds each for chunk sleeping)
-        assert len(sleep_calls) >= 1, "Scheduler should sleep while waiting"
+        assert len(wait_calls) == 2
+        assert wait_calls[1] > 500
+        scheduler.run_analysis.assert_not_called()
 
     def test_run_loop_checks_market_hours(self, mock_scheduler):
         """Verify loop checks market hours before running analysis."""
@@ -236,8 +420,9 @@ class TestSchedulerRunLoop:
             call_count[0] += 1
             if call_count[0] >= 2:
                 scheduler.stop()
+            return not scheduler._running
 
-        with patch("time.sleep", side_effect=stop_after_few):
+        with patch.object(scheduler._stop_event, "wait", side_effect=stop_after_few):
             scheduler.run_loop()
 
         # Should NOT have run analysis since market is closed
@@ -62,6 +62,56 @@ class TestGetTodaysTrades:
         assert len(trades) == 2
         assert all(t["timestamp_utc"].startswith(today_et) for t in trades)
 
+    def test_skips_trades_without_timestamp(self, tmp_path):
+        """Verify null or missing timestamps are skipped, not fatal."""
+        from automation.daily_report import get_todays_trades
+
+        today_et = datetime.now(ET).strftime("%Y-%m-%d")
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps([
+            {"timestamp_utc": None},
+            {},
+            {"timestamp_utc": f"{today_et}T10:00:00Z"},
+        ]))
+
+        assert len(get_todays_trades(str(trades_file))) == 1
+
+    def test_rereads_modified_file(self, tmp_path):
+        """Verify cached trades are refreshed when the file changes."""
+        import os
+
+        from automation.daily_report import get_todays_trades
+
+        today_et = datetime.now(ET).strftime("%Y-%m-%d")
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps([{"timestamp_utc": f"{today_et}T10:00:00Z"}]))
+        assert len(get_todays_trades(str(trades_file))) == 1
+
+        trades_file.write_text(json.dumps([
+            {"timestamp_utc": f"{today_et}T10:00:00Z"},
+            {"timestamp_utc": f"{today_et}T11:00:00Z"},
+        ]))
+        # Force a distinct mtime even on coarse-grained filesystems
+        st = trades_file.stat()
+        os.utime(trades_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert len(get_todays_trades(str(trades_file))) == 2
+
+    def test_drops_cache_when_file_removed(self, tmp_path):
+        """Verify a deleted log clears its cached slice."""
+        from automation.daily_report import _TRADES_CACHE, get_todays_trades
+
+        today_et = datetime.now(ET).strftime("%Y-%m-%d")
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps([{"timestamp_utc": f"{today_et}T10:00:00Z"}]))
+        get_todays_trades(str(trades_file))
+        assert str(trades_file) in _TRADES_CACHE
+
+        trades_file.unlink()
+
+        assert get_todays_trades(str(trades_file)) == []
+        assert str(trades_file) not in _TRADES_CACHE
+
 
 class TestCalculateDailyPnl:
     """Test calculate_daily_pnl function."""
@@ -238,20 +288,70 @@ class TestCreateDailyEmbed:
         assert any("Trade" in name for name in field_names)
 
 
+class TestFormatDetailedTrades:
+    """Test format_detailed_trades function."""
+
+    def test_exit_trade_lines(self):
+        """Verify an exit trade shows P&L, divider and indicators."""
+        from automation.daily_report import format_detailed_trades
+
+        trades = [{
+            "side": "SELL",
+            "quantity": 10,
+            "fill_price": 55.0,
+            "realized_pnl_usd": 50.0,
+            "entry_price": 50.0,
+            "rsi_value": 72.5,
+            "vwap_value": 54.0,
+            "timestamp_utc": "2024-01-02T15:30:00Z",
+        }]
+
+        lines = format_detailed_trades(trades).split("\n")
+
+        assert lines[0] == "**Trade #1** 🟢 **$+50.00** (+10.0%)"
+        assert lines[1] == "━━━━━━━━━━━━━━━━"
+        assert "   └ RSI: 72.5 | VWAP: $54.00" in lines
+
+    def test_truncates_to_field_limit(self):
+        """Verify long output is cut to fit a Discord embed field."""
+        from automation.daily_report import format_detailed_trades
+
+        trades = [
+            {"side": "BUY", "quantity": 1, "fill_price": 50.0, "signal_reason": "x" * 200}
+            for _ in range(50)
+        ]
+
+        result = format_detailed_trades(trades, max_trades=50)
+
+        assert len(result) == 1000
+        assert result.endswith("...")
+
+    def test_entry_trade_rsi_only(self):
+        """Verify the indicator line omits a missing VWAP."""
+        from automation.daily_report import format_detailed_trades
+
+        trades = [{"side": "BUY", "quantity": 10, "fill_price": 50.0, "rsi_value": 8.0}]
+
+        result = format_detailed_trades(trades)
+
+        assert "   └ RSI: 8.0\n" in result or result.endswith("   └ RSI: 8.0")
+        assert "VWAP" not in result
+
+
 class TestSendDailyReport:
     """Test send_daily_report function."""
 
-    @patch("automation.daily_report.AlpacaBroker")
-    @patch("automation.daily_report.requests")
+    @patch("execution.broker.AlpacaBroker")
+    @patch("automation.daily_report._get_session")
     @patch("automation.daily_report.get_settings")
-    @patch("automation.daily_report.calculate_daily_uptime")
+    @patch("automation.bot_analytics.calculate_daily_uptime")
     @patch("automation.daily_report.get_todays_trades")
     def test_send_success(
         self,
         mock_get_trades,
         mock_uptime,
         mock_settings,
-        mock_requests,
+        mock_get_session,
         mock_broker_class,
     ):
         """Verify successful report sending."""
@@ -273,14 +373,16 @@ class TestSendDailyReport:
 
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
-        mock_requests.post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
 
         from automation.daily_report import send_daily_report
 
         result = send_daily_report()
 
         assert result == True
-        mock_requests.post.assert_called_once()
+        mock_get_session.return_value.post.assert_called_once()
+        body = mock_get_session.return_value.post.call_args.kwargs["data"]
+        assert "embeds" in json.loads(body)
 
     @patch("automation.daily_report.get_settings")
     def test_fails_without_webhook(self, mock_settings):
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -110,10 +111,11 @@ class TestDiscordNotifier:
 
     def test_handles_request_exception(self):
         """Verify graceful handling of request exceptions."""
-        with patch("notifications.discord.requests") as mock_requests:
+        with patch("notifications.discord.get_webhook_session") as mock_get_session:
             import requests
-            mock_requests.post.side_effect = requests.exceptions.RequestException("Network error")
-            mock_requests.exceptions = requests.exceptions
+            mock_get_session.return_value.post.side_effect = (
+                requests.exceptions.RequestException("Network error")
+            )
 
             from notifications.discord import DiscordNotifier
             notifier = DiscordNotifier(webhook_url="https://discord.com/api/webhooks/test/test")
@@ -122,6 +124,92 @@ class TestDiscordNotifier:
             assert result == False
 
 
+class TestBackgroundNotifier:
+    """Test queued sending from a worker thread."""
+
+    def test_background_sends_post_in_order_after_flush(self):
+        """Verify queued messages are all posted, in order, by flush()."""
+        with patch("notifications.discord.get_webhook_session") as mock_get_session:
+            from notifications.discord import DiscordNotifier
+            notifier = DiscordNotifier(
+                webhook_url="https://discord.com/api/webhooks/test/test",
+                background=True,
+            )
+
+            assert notifier.send_message("first") == True
+            assert notifier.send_message("second") == True
+            notifier.flush()
+
+            posted = [
+                call.kwargs["json"]["content"]
+                for call in mock_get_session.return_value.post.call_args_list
+            ]
+            assert posted == ["first", "second"]
+
+    def test_background_disabled_without_webhook(self):
+        """Verify no worker is started when notifications are disabled."""
+        with patch("notifications.discord.get_settings") as mock_settings:
+            mock_settings.return_value.discord.webhook_url = ""
+
+            from notifications.discord import DiscordNotifier
+            notifier = DiscordNotifier(background=True)
+
+            assert notifier.send_message("test") == False
+            notifier.flush()
+
+
+class TestWebhookSession:
+    """Test the shared webhook session."""
+
+    def test_retries_rate_limited_posts(self, monkeypatch):
+        """Verify the session retries POSTs on 429 and 5xx responses."""
+        from notifications import webhook
+
+        monkeypatch.setattr(webhook, "_SESSION", None)
+
+        session = webhook.get_webhook_session()
+        retry = session.get_adapter("https://discord.com").max_retries
+
+        assert session is webhook.get_webhook_session()
+        assert retry.total == 3
+        assert 429 in retry.status_forcelist
+        assert retry.is_retry("POST", 429)
+
+    def test_does_not_resend_timed_out_posts(self, monkeypatch):
+        """Verify read timeouts are not retried and Retry-After is not honored."""
+        from notifications import webhook
+
+        monkeypatch.setattr(webhook, "_SESSION", None)
+
+        retry = webhook.get_webhook_session().get_adapter("https://discord.com").max_retries
+
+        assert retry.respect_retry_after_header is False
+        with pytest.raises(MaxRetryError):
+            retry.increment("POST", "/", error=ReadTimeoutError(None, "/", "timed out"))
+
+    def test_embed_body_round_trips(self):
+        """Verify the encoded body is a JSON payload with one embed."""
+        import json
+
+        from notifications.webhook import embed_body
+
+        embed = {"title": "📊 Weekly Report", "color": 0x00FF00}
+
+        assert json.loads(embed_body(embed)) == {"embeds": [embed]}
+
+    def test_embed_timestamp_format(self):
+        """Verify embed timestamps are UTC, second precision, Z suffix."""
+        from datetime import datetime, timezone
+
+        from notifications.webhook import embed_timestamp
+
+        stamp = embed_timestamp()
+
+        assert stamp.endswith(".000Z")
+        parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%S.000Z").replace(tzinfo=timezone.utc)
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+
+
 @pytest.mark.integration
 class TestDiscordIntegration:
     """Integration tests with real Discord webhook (test channel)."""
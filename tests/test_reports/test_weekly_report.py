@@ -31,6 +31,22 @@ class TestGetWeekRange:
         assert end_dt.weekday() == 4    # Friday
         assert (end_dt - start_dt).days == 4
 
+    def test_uses_given_time(self):
+        """Verify the range is computed from the time passed in."""
+        from automation.weekly_report import get_week_range
+
+        wednesday = ET.localize(datetime(2024, 12, 25, 18, 0))
+
+        assert get_week_range(wednesday) == ("2024-12-23", "2024-12-27")
+
+    def test_week_spanning_dst_change(self):
+        """Verify a Sunday after the fall-back change maps to the prior Monday."""
+        from automation.weekly_report import get_week_range
+
+        sunday_night = ET.localize(datetime(2024, 11, 3, 23, 30))
+
+        assert get_week_range(sunday_night) == ("2024-10-28", "2024-11-01")
+
 
 class TestGetWeeksTrades:
     """Test get_weeks_trades function."""
@@ -63,6 +79,34 @@ class TestGetWeeksTrades:
         # Should only include trades from current week
         assert len(trades) == 2
 
+    def test_caches_until_file_changes(self, tmp_path, monkeypatch):
+        """Verify repeat calls reuse the slice until the log is rewritten."""
+        from automation import weekly_report
+        from automation.weekly_report import get_week_range, get_weeks_trades
+
+        start, _ = get_week_range()
+        trades_file = tmp_path / "trades.json"
+        trades_file.write_text(json.dumps({"timestamp_utc": f"{start}T10:00:00Z"}) + "\n")
+
+        calls = []
+        real_trades_between = weekly_report.trades_between
+
+        def counting_trades_between(*args):
+            calls.append(args)
+            return real_trades_between(*args)
+
+        monkeypatch.setattr(weekly_report, "trades_between", counting_trades_between)
+
+        assert len(get_weeks_trades(str(trades_file))) == 1
+        assert len(get_weeks_trades(str(trades_file))) == 1
+        assert len(calls) == 1
+
+        with trades_file.open("a") as f:
+            f.write(json.dumps({"timestamp_utc": f"{start}T11:00:00Z"}) + "\n")
+
+        assert len(get_weeks_trades(str(trades_file))) == 2
+        assert len(calls) == 2
+
 
 class TestCalculateWeeklyStats:
     """Test calculate_weekly_stats function."""
@@ -132,6 +176,40 @@ class TestCalculateWeeklyStats:
         assert stats["total_trades"] == 2
         assert stats["total_pnl"] == 100.0
 
+    def test_trade_details_and_averages(self):
+        """Verify best/worst details keep the first tie and averages skip missing holds."""
+        from automation.weekly_report import calculate_weekly_stats
+
+        trades = [
+            {"id": 1, "realized_pnl_usd": 80.0, "holding_minutes": 30, "slippage": -0.02},
+            {"id": 2, "realized_pnl_usd": -40.0, "holding_minutes": None, "slippage": 0.04},
+            {"id": 3, "realized_pnl_usd": 80.0, "holding_minutes": 90},
+        ]
+
+        stats = calculate_weekly_stats(trades)
+
+        assert stats["best_trade_detail"]["id"] == 1
+        assert stats["worst_trade_detail"]["id"] == 2
+        assert stats["avg_holding_mins"] == 60
+        assert stats["avg_slippage"] == pytest.approx(0.02)
+
+
+class TestFormatTradeTime:
+    """Test format_trade_time function."""
+
+    def test_converts_utc_to_et_across_dst(self):
+        """Verify summer and winter timestamps use the matching ET offset."""
+        from automation.weekly_report import format_trade_time
+
+        assert format_trade_time("2024-07-01T14:30:00Z") == "07/01 10:30"
+        assert format_trade_time("2024-12-02T14:30:00+00:00") == "12/02 09:30"
+
+    def test_invalid_timestamp(self):
+        """Verify unparseable timestamps get a placeholder."""
+        from automation.weekly_report import format_trade_time
+
+        assert format_trade_time("not-a-time") == "??/?? ??:??"
+
 
 class TestCreateWeeklyEmbed:
     """Test create_weekly_embed function."""
@@ -196,6 +274,43 @@ class TestCreateWeeklyEmbed:
 
         assert embed["color"] == 0xFF0000  # Red
 
+    def test_gray_color_for_flat_week(self):
+        """Verify embed color is gray when weekly P&L is zero."""
+        from automation.weekly_report import calculate_weekly_stats, create_weekly_embed
+
+        embed = create_weekly_embed(
+            week_range="2024-12-23 ~ 2024-12-27",
+            equity=10000.0,
+            stats=calculate_weekly_stats([]),
+            position=None,
+        )
+
+        assert embed["color"] == 0x808080  # Gray
+
+    def test_uptime_field_totals(self):
+        """Verify the uptime field leads with the weekly total, then each day."""
+        from automation.bot_analytics import UptimeStats
+        from automation.weekly_report import calculate_weekly_stats, create_weekly_embed
+
+        weekly_uptime = [
+            UptimeStats("2024-12-23", 390, 390, 100.0, 1, 0, []),
+            UptimeStats("2024-12-24", 390, 195, 50.0, 1, 1, []),
+        ]
+
+        embed = create_weekly_embed(
+            week_range="2024-12-23 ~ 2024-12-27",
+            equity=10000.0,
+            stats=calculate_weekly_stats([]),
+            position=None,
+            weekly_uptime=weekly_uptime,
+        )
+
+        uptime_field = next(f for f in embed["fields"] if f["name"] == "🤖 Bot Uptime")
+        lines = uptime_field["value"].split("\n")
+        assert lines[0] == "🔴 **Weekly: 75.0%** (9h 45m)"
+        assert len(lines) == 3
+        assert "2024-12-24" in lines[2]
+
 
 class TestSendWeeklyReport:
     """Test send_weekly_report function."""
@@ -212,7 +327,7 @@ class TestSendWeeklyReport:
         assert result == False
 
     @patch("automation.weekly_report.AlpacaBroker")
-    @patch("automation.weekly_report.requests")
+    @patch("automation.weekly_report.get_webhook_session")
     @patch("automation.weekly_report.get_settings")
     @patch("automation.weekly_report.calculate_weekly_uptime")
     @patch("automation.weekly_report.analyze_no_trade_reason")
@@ -223,11 +338,12 @@ class TestSendWeeklyReport:
         mock_no_trade,
         mock_uptime,
         mock_settings,
-        mock_requests,
+        mock_get_session,
         mock_broker_class,
     ):
         """Verify successful weekly report sending."""
         mock_settings.return_value.discord.weekly_webhook_url = "https://discord.com/webhook/test"
+        mock_settings.return_value.discord.skip_empty_weekly = False
 
         mock_broker = Mock()
         mock_broker.get_account.return_value = {"equity": 10000.0}
@@ -245,11 +361,40 @@ class TestSendWeeklyReport:
 
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
-        mock_requests.post.return_value = mock_response
+        mock_get_session.return_value.post.return_value = mock_response
+
+        from automation.weekly_report import send_weekly_report
+
+        result = send_weekly_report()
+
+        assert result == True
+        mock_get_session.return_value.post.assert_called_once()
+
+    @patch("automation.weekly_report.AlpacaBroker")
+    @patch("automation.weekly_report.get_webhook_session")
+    @patch("automation.weekly_report.get_settings")
+    @patch("automation.weekly_report.calculate_weekly_uptime")
+    @patch("automation.weekly_report.analyze_no_trade_reason")
+    @patch("automation.weekly_report.get_weeks_trades")
+    def test_skips_empty_week_when_configured(
+        self,
+        mock_get_trades,
+        mock_no_trade,
+        mock_uptime,
+        mock_settings,
+        mock_get_session,
+        mock_broker_class,
+    ):
+        """Verify no post is made for a week without trades or uptime."""
+        mock_settings.return_value.discord.weekly_webhook_url = "https://discord.com/webhook/test"
+        mock_settings.return_value.discord.skip_empty_weekly = True
+        mock_broker_class.return_value.get_account.return_value = {"equity": 10000.0}
+        mock_get_trades.return_value = []
+        mock_uptime.return_value = [Mock(bot_running_minutes=0, uptime_pct=0.0)]
 
         from automation.weekly_report import send_weekly_report
 
         result = send_weekly_report()
 
         assert result == True
-        mock_requests.post.assert_called_once()
+        mock_get_session.return_value.post.assert_not_called()
@@ -98,6 +98,33 @@ class TestGetAccount:
             assert "buying_power" in account
 
 
+class TestClientSharing:
+    """Test lazy client creation."""
+
+    @requires_alpaca
+    def test_parallel_calls_share_one_client(self):
+        """Verify concurrent account/position calls create a single client."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_client = Mock()
+        mock_client.get_open_position.side_effect = Exception("position does not exist")
+
+        with patch("execution.broker.ALPACA_AVAILABLE", True), \
+             patch("execution.broker.TradingClient", return_value=mock_client) as mock_cls, \
+             patch("execution.services.account.ALPACA_AVAILABLE", True):
+
+            from execution.broker import AlpacaBroker
+
+            broker = AlpacaBroker(paper=True)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(broker.get_position, "TQQQ") for _ in range(8)]
+                for future in futures:
+                    future.result()
+
+            mock_cls.assert_called_once()
+            assert broker.account_service.client is mock_client
+
+
 class TestGetPosition:
     """Test get_position method."""
 
@@ -325,3 +325,35 @@ class TestGenerateSignals:
 
         # Just verify no crash
         assert signal is None or hasattr(signal, "signal_type")
+
+    def test_idx_matches_sliced_frame(self, mock_settings, oversold_ohlcv_data):
+        """Verify evaluating bar idx of the full frame matches slicing up to it."""
+        from strategy.signals import SignalGenerator
+
+        gen = SignalGenerator(rsi_period=2, rsi_oversold=30.0, sma_period=20)
+        df = gen.prepare_data(oversold_ohlcv_data)
+
+        for i in range(len(df)):
+            for kwargs in ({}, {"has_position": True, "entry_price": 30.0}):
+                at_idx = gen.generate_signals(df, idx=i, **kwargs)
+                sliced = gen.generate_signals(df.iloc[:i + 1], **kwargs)
+                assert (at_idx and at_idx.to_dict()) == (sliced and sliced.to_dict())
+
+    def test_candidate_masks_cover_every_signal(self, mock_settings, sample_ohlcv_data):
+        """Verify no bar that produces a signal is left out of the candidate masks."""
+        from strategy.signals import SignalGenerator
+
+        gen = SignalGenerator(
+            rsi_period=2, rsi_oversold=30.0, rsi_overbought=70.0, sma_period=20,
+            short_enabled=True, rsi_overbought_short=60.0,
+        )
+        df = gen.prepare_data(sample_ohlcv_data)
+        entries = gen.entry_candidates(df)
+        exits = gen.exit_candidates(df)
+
+        for i in range(len(df)):
+            if gen.generate_signals(df, idx=i) is not None:
+                assert entries[i]
+            # Entry far below any price, so the stop loss never fires
+            if gen.generate_exit_signal(df, entry_price=1e-9, idx=i) is not None:
+                assert exits[i]